@@ -0,0 +1,320 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from bareme import charger_bareme
+
+# ─────────────────────────────────────────────
+# DONNÉES ACTUARIELLES (source : Excel)
+# ─────────────────────────────────────────────
+# Barème lu depuis le classeur des actuaires ou son export CSV (donnees/),
+# validé puis mis en cache binaire : voir bareme.py
+_BAREME = charger_bareme()
+# Primes pures par âge (65–94) : (densité forte, densité faible)
+PRIMES_PURES = _BAREME.primes_pures
+TAUX_MARGE   = _BAREME.taux_marge
+TAUX_FRAIS   = _BAREME.taux_frais   # Autres paramètres!C8
+
+DENSITES = ('forte', 'faible')
+AGE_MIN  = min(PRIMES_PURES)
+AGE_MAX  = max(PRIMES_PURES)
+
+
+def calcul_prime_commerciale(age: int, densite: str) -> tuple[float, float, float]:
+    """Retourne (prime_pure, chargements, prime_commerciale) en €/an."""
+    idx         = 0 if densite == 'forte' else 1
+    prime_pure  = PRIMES_PURES[age][idx]
+    taux_marge  = TAUX_MARGE[densite]
+    prime_com   = prime_pure * (1 + taux_marge) / (1 - TAUX_FRAIS)
+    chargements = prime_com - prime_pure
+    return prime_pure, chargements, prime_com
+
+
+# ─────────────────────────────────────────────
+# CALCUL VECTORISÉ (tarification en masse)
+# ─────────────────────────────────────────────
+# Copie NumPy de PRIMES_PURES, aplatie : indice = (âge - AGE_MIN) * 2 + densité
+_TABLE_PRIMES = np.array(
+    [PRIMES_PURES[a] for a in range(AGE_MIN, AGE_MAX + 1)], dtype=np.float64
+).ravel()
+# Barème commercial aux taux par défaut, calculé par la formule scalaire
+# (résultats identiques au bit près à calcul_prime_commerciale)
+_TABLE_COM = np.array(
+    [calcul_prime_commerciale(a, d)[2] for a in range(AGE_MIN, AGE_MAX + 1) for d in DENSITES]
+)
+_TABLE_CHARGEMENTS = _TABLE_COM - _TABLE_PRIMES
+for _t in (_TABLE_PRIMES, _TABLE_COM, _TABLE_CHARGEMENTS):
+    _t.flags.writeable = False
+
+
+def _table_lignes(primes: np.ndarray, chargements: np.ndarray, primes_com: np.ndarray) -> np.ndarray:
+    """Barème en une table (âge * 2 + densité, [prime pure, chargements, prime commerciale]).
+
+    Indexée directement par l'âge (lignes sous AGE_MIN à NaN, jamais lues :
+    les âges sont vérifiés avant) : un seul take par calcul, sans décalage.
+    """
+    table = np.full((2 * (AGE_MAX + 1), 3), np.nan)
+    table[2 * AGE_MIN:] = np.stack([primes, chargements, primes_com], axis=1)
+    table.flags.writeable = False
+    return table
+
+
+_TABLE_LIGNES = _table_lignes(_TABLE_PRIMES, _TABLE_CHARGEMENTS, _TABLE_COM)
+
+def indices_densite(densites) -> np.ndarray:
+    """Convertit des densités en indices de colonne (0 = forte, 1 = faible).
+
+    Accepte des libellés 'forte'/'faible' ou des codes 0/1 (booléens
+    compris) ; les codes évitent deux comparaisons de chaînes par ligne.
+    """
+    densites = np.asarray(densites)
+    if densites.dtype.kind in "USO":
+        faible = densites == 'faible'
+        forte = np.count_nonzero(densites == 'forte')
+        if forte + np.count_nonzero(faible) != densites.size:
+            autres = densites[~faible]
+            valeur = str(autres[autres != 'forte'][0])
+            raise ValueError(f"Densité inconnue : {valeur!r} (attendu : 'forte' ou 'faible')")
+        return faible.view(np.uint8)
+    if densites.dtype.kind == "b":
+        return densites.view(np.uint8)
+    if densites.dtype.kind not in "iu":
+        if not np.array_equal(densites, np.floor(densites)):
+            raise ValueError("Les codes de densité doivent être entiers")
+        densites = densites.astype(np.int64)
+    if densites.size and (densites.min() < 0 or densites.max() > 1):
+        raise ValueError("Code de densité hors de {0, 1}")
+    return densites
+
+
+def calcul_primes_vectorise(
+    ages,
+    densites,
+    taux_marge=None,
+    taux_frais=None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Version vectorisée de calcul_prime_commerciale.
+
+    `ages` et `densites` sont des tableaux de même longueur (densités en
+    libellés ou en codes 0 = forte / 1 = faible). Avec les taux par densité,
+    les trois montants sont lus d'un seul take dans une table par âge et
+    densité (1M lignes : ~9 ms, environ 70x la boucle scalaire, voir
+    benchmarks/bench_vectorise.py). Les libellés ajoutent deux comparaisons
+    de chaînes (~25 ms) : passer des codes sur les gros volumes. `taux_marge` (dict par
+    densité, ou tableau par ligne) et `taux_frais` (scalaire ou tableau)
+    remplacent TAUX_MARGE / TAUX_FRAIS s'ils sont fournis.
+    Retourne (primes_pures, chargements, primes_commerciales) en €/an.
+    """
+    ages = np.asarray(ages)
+    if ages.dtype.kind not in "iu":
+        if not np.array_equal(ages, np.floor(ages)):
+            raise ValueError("Les âges doivent être entiers")
+        ages = ages.astype(np.int64)
+    if ages.size and (ages.min() < AGE_MIN or ages.max() > AGE_MAX):
+        raise ValueError(f"Âge hors barème ({AGE_MIN}–{AGE_MAX})")
+    colonnes = indices_densite(densites)
+
+    idx = np.multiply(ages, 2, dtype=np.intp)
+    idx += colonnes
+
+    if taux_marge is None:
+        taux_marge = TAUX_MARGE
+    frais = TAUX_FRAIS if taux_frais is None else np.asarray(taux_frais, dtype=np.float64)
+    if isinstance(taux_marge, dict) and np.ndim(frais) == 0:
+        # Taux par densité : barème recalculé sur ses 60 lignes, puis un seul take
+        if taux_marge is TAUX_MARGE and taux_frais is None:
+            table = _TABLE_LIGNES
+        else:
+            marges = np.tile([taux_marge[d] for d in DENSITES], AGE_MAX - AGE_MIN + 1)
+            primes_com = _TABLE_PRIMES * (1 + marges) / (1 - frais)
+            table = _table_lignes(_TABLE_PRIMES, primes_com - _TABLE_PRIMES, primes_com)
+        lignes = table.take(idx, axis=0)
+        return lignes[:, 0], lignes[:, 1], lignes[:, 2]
+
+    # Taux par ligne : formule appliquée élément par élément
+    primes_pures = _TABLE_LIGNES[:, 0].take(idx)
+    if isinstance(taux_marge, dict):
+        marges = np.array([taux_marge[d] for d in DENSITES], dtype=np.float64).take(colonnes)
+    else:
+        marges = np.asarray(taux_marge, dtype=np.float64)
+    primes_com  = primes_pures * (1 + marges) / (1 - frais)
+    chargements = primes_com - primes_pures
+    return primes_pures, chargements, primes_com
+
+
+# ─────────────────────────────────────────────
+# SENSIBILITÉ AUX TAUX DE MARGE ET DE FRAIS
+# ─────────────────────────────────────────────
+def grille_sensibilite(taux_marge, taux_frais) -> tuple[np.ndarray, np.ndarray]:
+    """Primes commerciales et chargements pour chaque couple (frais, marge).
+
+    `taux_marge` et `taux_frais` sont des vecteurs de taux balayés ; le
+    calcul est un seul produit diffusé sur le barème complet. Retourne deux
+    tableaux de forme (frais, marge, âge, densité), âge = indice - AGE_MIN.
+    """
+    marges = np.asarray(taux_marge, dtype=np.float64)
+    frais = np.asarray(taux_frais, dtype=np.float64)
+    if marges.size and marges.min() < 0 or frais.size and (frais.min() < 0 or frais.max() >= 1):
+        raise ValueError("Taux hors bornes (marge ≥ 0, frais dans [0, 1[)")
+    primes_pures = _TABLE_PRIMES.reshape(AGE_MAX - AGE_MIN + 1, len(DENSITES))
+    coefficients = (1 + marges)[None, :] / (1 - frais)[:, None]
+    primes_com = coefficients[:, :, None, None] * primes_pures
+    return primes_com, primes_com - primes_pures
+
+
+# ─────────────────────────────────────────────
+# ÂGE EXACT ET ÉCHÉANCIERS
+# ─────────────────────────────────────────────
+JOURS_PAR_AN   = 365.2425
+PERIODICITES   = {'annuelle': 1, 'semestrielle': 2, 'trimestrielle': 4, 'mensuelle': 12}
+
+
+def age_exact(dates_naissance, date_effet) -> np.ndarray:
+    """Âge en années décimales à la date d'effet (dates ISO ou datetime64)."""
+    naissances = np.asarray(dates_naissance, dtype="datetime64[D]")
+    effet = np.asarray(date_effet, dtype="datetime64[D]")
+    return (effet - naissances).astype(np.float64) / JOURS_PAR_AN
+
+
+def primes_interpolees(ages, densites, table: np.ndarray = _TABLE_COM) -> np.ndarray:
+    """Prime annuelle à un âge décimal, par interpolation linéaire de `table`
+    (barème aplati, commercial par défaut ; _TABLE_PRIMES pour les primes pures)
+    entre les deux âges entiers qui l'encadrent. Au-delà de AGE_MAX la prime
+    reste celle de AGE_MAX ; en dessous de AGE_MIN, ValueError."""
+    ages = np.asarray(ages, dtype=np.float64)
+    colonnes = indices_densite(densites)
+    if ages.size and ages.min() < AGE_MIN:
+        raise ValueError(f"Âge inférieur à {AGE_MIN} ans")
+    position = np.minimum(ages - AGE_MIN, AGE_MAX - AGE_MIN)
+    bas = position.astype(np.intp)
+    poids = position - bas
+    haut = np.minimum(bas + 1, AGE_MAX - AGE_MIN)
+    valeur_bas = table.take(bas * 2 + colonnes)
+    valeur_haut = table.take(haut * 2 + colonnes)
+    return valeur_bas + poids * (valeur_haut - valeur_bas)
+
+
+def echeancier(ages, densites, periodicite: str | int = 'mensuelle') -> np.ndarray:
+    """Échéances de l'année de contrat, tableau (nombre de contrats, échéances).
+
+    `ages` : âges (décimaux) à la date d'effet. L'échéance k couvre la
+    fraction [k/n, (k+1)/n[ de l'année ; elle vaut la prime interpolée à
+    l'âge atteint au milieu de cette période, divisée par n. Les montants
+    sont arrondis au centime, l'écart d'arrondi étant porté par la dernière
+    échéance pour que leur somme égale le total annuel arrondi.
+    """
+    n = PERIODICITES[periodicite] if isinstance(periodicite, str) else int(periodicite)
+    if n < 1:
+        raise ValueError("La périodicité doit être d'au moins une échéance par an")
+    ages = np.asarray(ages, dtype=np.float64)
+    if ages.size and ages.max() > AGE_MAX + 1:
+        raise ValueError(f"Âge hors barème ({AGE_MIN}–{AGE_MAX})")
+    milieux = ages[:, None] + (np.arange(n) + 0.5) / n
+    colonnes = np.broadcast_to(indices_densite(densites)[:, None], milieux.shape)
+    brutes = primes_interpolees(milieux, colonnes) / n
+
+    echeances = np.round(brutes, 2)
+    total = np.round(brutes.sum(axis=1), 2)
+    echeances[:, -1] = np.round(total - echeances[:, :-1].sum(axis=1), 2)
+    return echeances
+
+
+# ─────────────────────────────────────────────
+# GRILLE TARIFAIRE PRÉCALCULÉE
+# ─────────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class GrilleTarifaire:
+    """Barème complet (âges × densités) figé en tableaux NumPy en lecture seule.
+
+    Les tableaux ont la forme (nombre d'âges, 2) : ligne = âge - age_min,
+    colonne = densité (0 = forte, 1 = faible). `projections` a la forme
+    (âge d'entrée, densité, année de contrat) : prime commerciale payée
+    l'année t par un assuré entré à cet âge (0 au-delà de AGE_MAX) ;
+    `cumuls` en est la somme cumulée sur les années.
+    """
+    age_min: int
+    primes_pures: np.ndarray
+    chargements: np.ndarray
+    primes_commerciales: np.ndarray
+    taux_marge: tuple[float, float] | np.ndarray   # par densité, ou par cellule (forme des tableaux)
+    taux_frais: float | np.ndarray
+    projections: np.ndarray
+    cumuls: np.ndarray
+
+    def devis(self, age: int, densite: str) -> tuple[float, float, float]:
+        """Retourne (prime_pure, chargements, prime_commerciale) en €/an."""
+        i = age - self.age_min
+        if not 0 <= i < len(self.primes_pures):
+            raise KeyError(age)
+        j = DENSITES.index(densite)
+        return (
+            float(self.primes_pures[i, j]),
+            float(self.chargements[i, j]),
+            float(self.primes_commerciales[i, j]),
+        )
+
+    def projection(
+        self,
+        age: int,
+        densite: str,
+        indexation: float = 0.0,
+        actualisation: float = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Projection de l'âge d'entrée jusqu'au dernier âge du barème.
+
+        Retourne (âges atteints, prime de chaque année, coût cumulé) en €.
+        `indexation` revalorise la prime de ce taux chaque année ;
+        `actualisation` ramène chaque année en valeur d'aujourd'hui.
+        Sans taux, les deux tableaux sont des vues sur le cube précalculé.
+        """
+        i = age - self.age_min
+        if not 0 <= i < len(self.primes_pures):
+            raise KeyError(age)
+        j = DENSITES.index(densite)
+        annees = len(self.primes_pures) - i
+        ages = np.arange(age, age + annees)
+        primes = self.projections[i, j, :annees]
+        if not indexation and not actualisation:
+            return ages, primes, self.cumuls[i, j, :annees]
+        primes = primes * ((1 + indexation) / (1 + actualisation)) ** np.arange(annees)
+        return ages, primes, np.cumsum(primes)
+
+
+def construire_grille(taux_marge=None, taux_frais=None) -> GrilleTarifaire:
+    """Précalcule la grille complète (taux par défaut : TAUX_MARGE / TAUX_FRAIS)."""
+    ages = np.repeat(np.arange(AGE_MIN, AGE_MAX + 1), len(DENSITES))
+    densites = np.tile(np.arange(len(DENSITES)), AGE_MAX - AGE_MIN + 1)
+    tableaux = calcul_primes_vectorise(ages, densites, taux_marge, taux_frais)
+    forme = (AGE_MAX - AGE_MIN + 1, len(DENSITES))
+    pp, ch, pc = (np.ascontiguousarray(t).reshape(forme) for t in tableaux)
+    for t in (pp, ch, pc):
+        t.flags.writeable = False
+    # Cube des projections : décalage de la colonne des primes de t années
+    n = forme[0]
+    annees = np.arange(n)
+    atteint = annees[:, None] + annees[None, :]             # (âge d'entrée, année)
+    projections = np.where(
+        (atteint < n)[:, None, :],
+        pc[np.minimum(atteint, n - 1)].transpose(0, 2, 1),
+        0.0,
+    )
+    cumuls = np.cumsum(projections, axis=2)
+    for t in (projections, cumuls):
+        t.flags.writeable = False
+    if taux_marge is None:
+        taux_marge = TAUX_MARGE
+    if isinstance(taux_marge, dict):
+        marges = tuple(taux_marge[d] for d in DENSITES)
+    else:
+        # Scalaire ou tableau par cellule, comme calcul_primes_vectorise
+        marges = np.broadcast_to(np.asarray(taux_marge, dtype=np.float64), (pp.size,)).reshape(forme)
+    return GrilleTarifaire(
+        age_min=AGE_MIN,
+        primes_pures=pp,
+        chargements=ch,
+        primes_commerciales=pc,
+        taux_marge=marges,
+        taux_frais=TAUX_FRAIS if taux_frais is None else taux_frais,
+        projections=projections,
+        cumuls=cumuls,
+    )
@@ -0,0 +1,228 @@
+"""Chargement du barème actuariel depuis le classeur des actuaires ou son export CSV.
+
+Source (UMBRELLA_BAREME, sinon donnees/bareme.xlsx s'il existe, sinon
+donnees/bareme.csv) :
+
+    CSV    en-tête « age,forte,faible », une ligne par âge, puis des lignes de
+           paramètres nommées dans la première colonne :
+               taux_marge,<forte>,<faible>
+               taux_frais,<valeur>
+    XLSX   feuille « Primes pures » : colonnes Âge / forte / faible repérées
+           par leur en-tête ; feuille « Autres paramètres » : taux de frais
+           en C8, taux de marge sur les lignes dont le libellé contient
+           « marge » et « forte » / « faible » (valeur dans la cellule suivante).
+           Lecture par openpyxl, dépendance optionnelle.
+
+Le barème validé est compilé dans .cache/bareme/<sha256 de la source>.npy :
+les démarrages suivants, tant que la source ne change pas, se contentent de
+hacher le fichier et de projeter le cache en mémoire, sans relire le tableur.
+"""
+import csv
+import hashlib
+import math
+import os
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+from ressources import RACINE, hash_fichier
+
+DOSSIER_DONNEES      = os.path.join(RACINE, "donnees")
+DOSSIER_CACHE_BAREME = os.path.join(RACINE, ".cache", "bareme")
+FEUILLE_PRIMES       = "Primes pures"
+FEUILLE_PARAMETRES   = "Autres paramètres"
+CELLULE_FRAIS        = "C8"
+# Incrémenté si la disposition du cache change
+VERSION_CACHE        = 1
+
+# Cache : [âge min, nombre d'âges, marge forte, marge faible, frais, primes (forte, faible)…]
+_ENTETE_CACHE = 5
+
+
+class ErreurBareme(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Bareme:
+    primes_pures: dict[int, tuple[float, float]]
+    taux_marge: dict[str, float]
+    taux_frais: float
+    source: str
+
+
+# ─────────────────────────────────────────────
+# LECTURE DES SOURCES
+# ─────────────────────────────────────────────
+def _nombre(valeur, contexte: str) -> float:
+    try:
+        nombre = float(str(valeur).replace(",", ".")) if isinstance(valeur, str) else float(valeur)
+    except (TypeError, ValueError):
+        raise ErreurBareme(f"{contexte} : valeur non numérique {valeur!r}") from None
+    return nombre
+
+
+def _cellules(ligne: list, nombre: int, contexte: str) -> list:
+    if len(ligne) < nombre:
+        raise ErreurBareme(f"{contexte} : {nombre} colonnes attendues, lu {len(ligne)} ({','.join(ligne)})")
+    return ligne
+
+
+def lire_csv(chemin: str) -> tuple[dict, dict, float | None]:
+    primes, marges, frais = {}, {}, None
+    with open(chemin, encoding="utf-8-sig", newline="") as f:
+        lignes = csv.reader(f)
+        entete = [c.strip().lower() for c in next(lignes, [])]
+        if entete[:3] != ["age", "forte", "faible"]:
+            raise ErreurBareme(f"{chemin} : en-tête attendu « age,forte,faible », lu {entete!r}")
+        for numero, ligne in enumerate(lignes, start=2):
+            if not ligne or not ligne[0].strip():
+                continue
+            cle = ligne[0].strip().lower()
+            contexte = f"{chemin}, ligne {numero}"
+            ligne = _cellules(ligne, 2 if cle == "taux_frais" else 3, contexte)
+            if cle == "taux_marge":
+                marges = {"forte": _nombre(ligne[1], contexte), "faible": _nombre(ligne[2], contexte)}
+            elif cle == "taux_frais":
+                frais = _nombre(ligne[1], contexte)
+            else:
+                age = _nombre(cle, contexte)
+                if age != int(age) or int(age) in primes:
+                    raise ErreurBareme(f"{contexte} : âge invalide ou en double ({cle})")
+                primes[int(age)] = (_nombre(ligne[1], contexte), _nombre(ligne[2], contexte))
+    return primes, marges, frais
+
+
+def lire_xlsx(chemin: str) -> tuple[dict, dict, float | None]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ErreurBareme(
+            f"{chemin} : la lecture des classeurs Excel requiert openpyxl (pip install openpyxl) "
+            f"— ou fournir l'export CSV"
+        ) from None
+    classeur = load_workbook(chemin, read_only=True, data_only=True)
+    try:
+        for feuille in (FEUILLE_PRIMES, FEUILLE_PARAMETRES):
+            if feuille not in classeur.sheetnames:
+                raise ErreurBareme(f"{chemin} : feuille « {feuille} » introuvable")
+
+        primes, colonnes = {}, None
+        for numero, ligne in enumerate(classeur[FEUILLE_PRIMES].iter_rows(values_only=True), start=1):
+            if colonnes is None:
+                libelles = [str(c or "").strip().lower() for c in ligne]
+                trouve = [
+                    next((i for i, l in enumerate(libelles) if mot in l), None)
+                    for mot in ("âge", "forte", "faible")
+                ]
+                if None not in trouve:
+                    colonnes = trouve
+                continue
+            if ligne[colonnes[0]] is None:
+                continue
+            contexte = f"{FEUILLE_PRIMES}!ligne {numero}"
+            age = _nombre(ligne[colonnes[0]], contexte)
+            if age != int(age) or int(age) in primes:
+                raise ErreurBareme(f"{contexte} : âge invalide ou en double ({ligne[colonnes[0]]})")
+            primes[int(age)] = (
+                _nombre(ligne[colonnes[1]], contexte), _nombre(ligne[colonnes[2]], contexte)
+            )
+        if colonnes is None:
+            raise ErreurBareme(f"{chemin} : en-tête Âge / forte / faible introuvable dans « {FEUILLE_PRIMES} »")
+
+        parametres = classeur[FEUILLE_PARAMETRES]
+        frais = parametres[CELLULE_FRAIS].value
+        frais = None if frais is None else _nombre(frais, f"{FEUILLE_PARAMETRES}!{CELLULE_FRAIS}")
+        marges = {}
+        for ligne in parametres.iter_rows(values_only=True):
+            for i, cellule in enumerate(ligne[:-1]):
+                libelle = str(cellule or "").lower()
+                if "marge" in libelle:
+                    for densite in ("forte", "faible"):
+                        if densite in libelle:
+                            marges[densite] = _nombre(ligne[i + 1], f"{FEUILLE_PARAMETRES} ({cellule})")
+        return primes, marges, frais
+    finally:
+        classeur.close()
+
+
+# ─────────────────────────────────────────────
+# VALIDATION
+# ─────────────────────────────────────────────
+def valider(primes: dict, marges: dict, frais: float | None, source: str) -> Bareme:
+    if not primes:
+        raise ErreurBareme(f"{source} : aucune prime pure")
+    ages = sorted(primes)
+    if ages != list(range(ages[0], ages[-1] + 1)):
+        manquants = sorted(set(range(ages[0], ages[-1] + 1)) - set(ages))
+        raise ErreurBareme(f"{source} : âges manquants dans le barème : {manquants}")
+    for age, valeurs in primes.items():
+        if not all(math.isfinite(v) and v > 0 for v in valeurs):
+            raise ErreurBareme(f"{source} : prime pure invalide à {age} ans : {valeurs}")
+    if set(marges) != {"forte", "faible"}:
+        raise ErreurBareme(f"{source} : taux de marge forte / faible manquants")
+    for nom, taux in [*((f"marge {d}", t) for d, t in marges.items()), ("frais", frais)]:
+        if taux is None or not 0 <= taux < 1:
+            raise ErreurBareme(f"{source} : taux de {nom} hors de [0, 1[ : {taux!r}")
+    return Bareme(
+        primes_pures={a: primes[a] for a in ages},
+        taux_marge={"forte": marges["forte"], "faible": marges["faible"]},
+        taux_frais=frais,
+        source=source,
+    )
+
+
+# ─────────────────────────────────────────────
+# CACHE BINAIRE
+# ─────────────────────────────────────────────
+def _compiler(bareme: Bareme) -> np.ndarray:
+    ages = list(bareme.primes_pures)
+    return np.concatenate([
+        [ages[0], len(ages), bareme.taux_marge["forte"], bareme.taux_marge["faible"], bareme.taux_frais],
+        np.array([bareme.primes_pures[a] for a in ages], dtype=np.float64).ravel(),
+    ])
+
+
+def _decompiler(donnees: np.ndarray, source: str) -> Bareme:
+    age_min, n = int(donnees[0]), int(donnees[1])
+    table = donnees[_ENTETE_CACHE:].reshape(n, 2).tolist()
+    return Bareme(
+        primes_pures={age_min + i: tuple(v) for i, v in enumerate(table)},
+        taux_marge={"forte": float(donnees[2]), "faible": float(donnees[3])},
+        taux_frais=float(donnees[4]),
+        source=source,
+    )
+
+
+def source_bareme() -> str:
+    if os.environ.get("UMBRELLA_BAREME"):
+        return os.environ["UMBRELLA_BAREME"]
+    classeur = os.path.join(DOSSIER_DONNEES, "bareme.xlsx")
+    return classeur if os.path.exists(classeur) else os.path.join(DOSSIER_DONNEES, "bareme.csv")
+
+
+def charger_bareme(chemin: str | None = None) -> Bareme:
+    """Barème validé, lu depuis le cache binaire si la source n'a pas changé."""
+    chemin = os.path.abspath(chemin or source_bareme())
+    ext = os.path.splitext(chemin)[1].lower()
+    if ext not in (".csv", ".xlsx", ".xlsm"):
+        raise ErreurBareme(f"Format de barème non reconnu : {chemin!r} (attendu : .csv ou .xlsx)")
+    cle = hashlib.sha256(f"{hash_fichier(chemin)}:{VERSION_CACHE}".encode()).hexdigest()
+    cache = os.path.join(DOSSIER_CACHE_BAREME, f"{cle}.npy")
+    try:
+        return _decompiler(np.load(cache, mmap_mode="r"), chemin)
+    except (OSError, ValueError, IndexError, EOFError, struct.error):
+        pass   # cache absent, tronqué ou illisible : reconstruit depuis la source
+
+    lire = lire_csv if ext == ".csv" else lire_xlsx
+    bareme = valider(*lire(chemin), source=chemin)
+    try:
+        os.makedirs(DOSSIER_CACHE_BAREME, exist_ok=True)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, _compiler(bareme))
+        os.replace(tmp, cache)
+    except OSError:
+        pass   # dossier en lecture seule : le barème reste utilisable, sans cache
+    return bareme
@@ -0,0 +1,187 @@
+"""Profil du démarrage à froid : serveur, imports et premier visiteur.
+
+Usage :
+    python benchmarks/bench_demarrage.py                  # streamlit run / demarrage.py
+    python benchmarks/bench_demarrage.py --disque-froid   # + caches disque vidés
+    python benchmarks/bench_demarrage.py --imports 25 --json demarrage.json
+
+Pour chaque mode de lancement, un serveur neuf est démarré sous
+`python -X importtime` avec le profilage par section actif
+(UMBRELLA_PROFIL, résultats lus dans UMBRELLA_PROFIL_JSONL), puis :
+    prêt        lancement → premier contrôle de santé réussi (/_stcore/health)
+    premier     première session : chargement complet de la page, mesuré
+                côté client sur le websocket (voir charge_sessions.py)
+    suivant     session suivante, caches du processus chauds
+Modes : `streamlit run app.py` (tout est fait pendant le premier rerun) et
+`python demarrage.py` (caches préchauffés avant l'ouverture du serveur).
+Le rapport donne aussi les imports les plus coûteux du serveur (temps
+cumulé par module de premier niveau) et le détail par section de la page
+du premier et du second visiteur.
+
+--disque-froid vide static/cache/ et .cache/ (variantes d'images, feuille
+publiée, barème compilé, vidéo faststart) avant chaque mode, comme dans un
+conteneur neuf : tout est régénéré au premier besoin.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, RACINE)
+from charge_sessions import SCRIPT, ErreurSession, Session, attendre_serveur, port_libre  # noqa: E402
+
+MODES = {
+    "streamlit run": [sys.executable, "-X", "importtime", "-m", "streamlit", "run", SCRIPT],
+    "demarrage.py": [sys.executable, "-X", "importtime", os.path.join(RACINE, "demarrage.py")],
+}
+OPTIONS_SERVEUR = ["--server.headless", "true", "--server.fileWatcherType", "none",
+                   "--browser.gatherUsageStats", "false"]
+MODULES_PROJET = (
+    "actuariat", "bareme", "calculateur", "contenu", "demarrage", "images",
+    "journal_devis", "polices", "profilage", "ressources", "sections", "video",
+)
+CACHES_DISQUE = (os.path.join(RACINE, "static", "cache"), os.path.join(RACINE, ".cache"))
+DELAI = 120   # secondes, démarrage du serveur
+
+
+# ─────────────────────────────────────────────
+# MESURE
+# ─────────────────────────────────────────────
+def vider_caches_disque():
+    for dossier in CACHES_DISQUE:
+        if not os.path.isdir(dossier):
+            continue
+        for nom in os.listdir(dossier):
+            chemin = os.path.join(dossier, nom)
+            if os.path.isdir(chemin):
+                shutil.rmtree(chemin)
+            elif nom != ".gitkeep":
+                os.remove(chemin)
+
+
+def lire_importtime(sortie: str) -> dict[str, float]:
+    """Temps cumulé (ms) par import de premier niveau, d'après -X importtime."""
+    cumuls = {}
+    for ligne in sortie.splitlines():
+        if not ligne.startswith("import time:"):
+            continue
+        _, cumul, nom = ligne[len("import time:"):].split("|")
+        # En-tête, puis imports imbriqués (nom indenté de plus d'une espace)
+        if not cumul.strip().isdigit() or nom.startswith("  "):
+            continue
+        nom = nom.strip()
+        cumuls[nom] = cumuls.get(nom, 0) + int(cumul) / 1000
+    return cumuls
+
+
+async def _visiteur(url: str) -> float:
+    session = Session(url, DELAI)
+    try:
+        return await session.charger()
+    finally:
+        await session.fermer()
+
+
+def mesurer(commande: list[str], disque_froid: bool) -> dict:
+    if disque_froid:
+        vider_caches_disque()
+    port = port_libre()
+    url = f"http://127.0.0.1:{port}/"
+    with tempfile.TemporaryDirectory() as dossier:
+        profils = os.path.join(dossier, "profil.jsonl")
+        journal = os.path.join(dossier, "serveur.log")
+        env = {**os.environ, "UMBRELLA_PROFIL": "1", "UMBRELLA_PROFIL_JSONL": profils,
+               "UMBRELLA_JOURNAL_DEVIS": os.path.join(dossier, "devis.jsonl")}
+        env.pop("UMBRELLA_DEMARRAGE_RAPIDE", None)
+        with open(journal, "w", encoding="utf-8") as sortie:
+            debut = time.perf_counter()
+            serveur = subprocess.Popen(
+                [*commande, "--server.port", str(port), *OPTIONS_SERVEUR],
+                cwd=RACINE, env=env, stdout=subprocess.DEVNULL, stderr=sortie,
+            )
+            try:
+                attendre_serveur(url, DELAI)
+                pret = time.perf_counter() - debut
+                premier = asyncio.run(_visiteur(url))
+                suivant = asyncio.run(_visiteur(url))
+            finally:
+                serveur.terminate()
+                serveur.wait(timeout=10)
+        with open(journal, encoding="utf-8") as f:
+            imports = lire_importtime(f.read())
+        with open(profils, encoding="utf-8") as f:
+            sections = [json.loads(l)["sections"] for l in f]
+    return {
+        "pret_ms": round(pret * 1000, 1),
+        "premier_ms": round(premier, 1),
+        "suivant_ms": round(suivant, 1),
+        "imports": imports,
+        "sections": sections,
+    }
+
+
+# ─────────────────────────────────────────────
+# RAPPORT
+# ─────────────────────────────────────────────
+def afficher_imports(imports: dict[str, float], nombre: int):
+    print(f"Imports de premier niveau du serveur (cumulé, -X importtime), {nombre} plus coûteux :")
+    for nom, ms in sorted(imports.items(), key=lambda e: -e[1])[:nombre]:
+        marque = "  (projet)" if nom in MODULES_PROJET else ""
+        print(f"  {nom:<44}{ms:>9.1f} ms{marque}")
+    projet = sum(ms for nom, ms in imports.items() if nom in MODULES_PROJET)
+    print(f"  {'total modules du projet':<44}{projet:>9.1f} ms")
+
+
+def afficher_modes(resultats: dict[str, dict]):
+    print(f"\n{'':<26}" + "".join(f"{nom:>16}" for nom in resultats))
+    for cle, libelle in (("pret_ms", "serveur prêt"), ("premier_ms", "premier visiteur"),
+                         ("suivant_ms", "visiteur suivant")):
+        print(f"{libelle:<26}" + "".join(f"{r[cle]:>13.1f} ms" for r in resultats.values()))
+
+
+def afficher_sections(resultats: dict[str, dict]):
+    print("\nPage du premier visiteur par section (mur, ms), visiteur suivant entre parenthèses :")
+    print(f"  {'section':<24}" + "".join(f"{nom:>22}" for nom in resultats))
+    noms = [m["section"] for m in next(iter(resultats.values()))["sections"][0]]
+    for i, section in enumerate(noms):
+        cellules = []
+        for r in resultats.values():
+            premier, suivant = (r["sections"][k][i]["mur_ms"] for k in (0, 1))
+            cellules.append(f"{premier:>12.1f} ({suivant:>6.1f})")
+        print(f"  {section:<24}" + "".join(f"{c:>22}" for c in cellules))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profil du démarrage à froid de app.py.")
+    parser.add_argument("--disque-froid", action="store_true",
+                        help="vide static/cache/ et .cache/ avant chaque mode")
+    parser.add_argument("--imports", type=int, default=15,
+                        help="nombre d'imports de premier niveau listés (défaut : 15)")
+    parser.add_argument("--json", help="écrit aussi les résultats bruts dans ce fichier")
+    args = parser.parse_args(argv)
+
+    try:
+        resultats = {nom: mesurer(commande, args.disque_froid) for nom, commande in MODES.items()}
+    except (ErreurSession, OSError, ValueError, KeyError, IndexError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+
+    afficher_imports(resultats["streamlit run"]["imports"], args.imports)
+    afficher_modes(resultats)
+    afficher_sections(resultats)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Banc de mesure des reruns de app.py (Streamlit AppTest, sans navigateur).
+
+Usage :
+    python benchmarks/bench_reruns.py                 # compare à baseline.json
+    python benchmarks/bench_reruns.py --enregistrer   # met à jour baseline.json
+
+Scénarios :
+    premier_chargement  nouvelle session, première exécution du script
+    calcul              soumission du calculateur, âges 65–94 × deux densités
+    erreur_nom          soumission sans prénom
+    contact             ouverture de la boîte de dialogue « Contact »
+
+Après chaque exécution, hors chronométrage, le rendu attendu est vérifié
+(formulaire affiché, carte de résultat au bon tarif, message d'erreur sur
+le prénom, boîte de dialogue ouverte) : un scénario qui ne produit plus sa
+page arrête le banc au lieu de mesurer un rerun vide.
+
+Pour chaque scénario : p50 / p95 / p99 du temps d'exécution du script (ms)
+et pic d'allocations Python par exécution (Kio, tracemalloc, passe séparée
+pour ne pas fausser les temps). Le code de retour vaut 1 si un p50 ou p95
+dépasse la référence de plus de --tolerance. La référence est enregistrée
+avec au moins 100 exécutions par scénario : sur 20, le p95 n'est que la
+deuxième plus lente et varie trop d'une mesure à l'autre.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(RACINE, "app.py")
+REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+sys.path.insert(0, RACINE)
+from actuariat import AGE_MAX, AGE_MIN, calcul_prime_commerciale  # noqa: E402
+from journal_devis import journal_devis  # noqa: E402
+
+DELAI = 60   # secondes, par exécution
+REPETITIONS_REFERENCE = 100
+
+
+def _session():
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+    # Avertissements « missing ScriptRunContext » d'AppTest : sans intérêt ici
+    set_log_level("error")
+    return AppTest.from_file(SCRIPT, default_timeout=DELAI)
+
+
+def _verifier(at):
+    if at.exception:
+        raise RuntimeError(f"Exception dans app.py : {at.exception[0].message}")
+
+
+def _markdown(at, texte: str) -> bool:
+    return any(texte in m.value for m in at.markdown)
+
+
+def _attendu(condition: bool, message: str):
+    if not condition:
+        raise RuntimeError(f"Rendu inattendu : {message}")
+
+
+# ─────────────────────────────────────────────
+# SCÉNARIOS
+# Chaque scénario produit des triplets (session, exécution mesurée,
+# vérification du rendu)
+# ─────────────────────────────────────────────
+def scenario_premier_chargement(repetitions: int):
+    def verifier(at):
+        _attendu(any(b.key == "btn_calculer" for b in at.button), "bouton du calculateur absent")
+
+    for _ in range(repetitions):
+        at = _session()
+        yield at, lambda at=at: at.run(), verifier
+
+
+def scenario_calcul(repetitions: int):
+    at = _session().run()
+    _verifier(at)
+    for _ in range(max(1, repetitions // 20)):
+        for age in range(AGE_MIN, AGE_MAX + 1):
+            for index_zone in (0, 1):
+                def executer(at=at, age=age, index_zone=index_zone):
+                    at.text_input(key="devis_nom").input("Marie-Claire")
+                    at.number_input(key="devis_age").set_value(age)
+                    at.selectbox(key="devis_zone").select_index(index_zone)
+                    at.button(key="btn_calculer").click()
+                    return at.run()
+
+                def verifier(at, age=age, densite=("forte", "faible")[index_zone]):
+                    prime = calcul_prime_commerciale(age, densite)[2]
+                    _attendu(
+                        _markdown(at, "Offre personnalisée pour Marie-Claire")
+                        and _markdown(at, f"{prime:.2f} <span>€ / an</span>"),
+                        f"carte de résultat absente ou tarif ≠ {prime:.2f} € ({age} ans, {densite})",
+                    )
+                yield at, executer, verifier
+
+
+def scenario_erreur_nom(repetitions: int):
+    at = _session().run()
+    _verifier(at)
+    for _ in range(repetitions):
+        def executer(at=at):
+            at.text_input(key="devis_nom").input("")
+            at.button(key="btn_calculer").click()
+            return at.run()
+
+        def verifier(at):
+            _attendu(
+                any("prénom" in e.value for e in at.error) and not _markdown(at, "result-card"),
+                "message « prénom » absent ou carte de résultat affichée",
+            )
+        yield at, executer, verifier
+
+
+def scenario_contact(repetitions: int):
+    at = _session().run()
+    _verifier(at)
+    def verifier(at):
+        _attendu(_markdown(at, "EASTER EGG"), "boîte de dialogue « Contact » non ouverte")
+
+    for _ in range(repetitions):
+        yield at, lambda at=at: at.button(key="btn_contact").click().run(), verifier
+
+
+SCENARIOS = {
+    "premier_chargement": scenario_premier_chargement,
+    "calcul": scenario_calcul,
+    "erreur_nom": scenario_erreur_nom,
+    "contact": scenario_contact,
+}
+
+
+# ─────────────────────────────────────────────
+# MESURE
+# ─────────────────────────────────────────────
+def centile(valeurs: list[float], p: float) -> float:
+    valeurs = sorted(valeurs)
+    rang = (len(valeurs) - 1) * p / 100
+    bas = int(rang)
+    haut = min(bas + 1, len(valeurs) - 1)
+    return valeurs[bas] + (valeurs[haut] - valeurs[bas]) * (rang - bas)
+
+
+def mesurer(nom: str, repetitions: int) -> dict:
+    temps = []
+    for at, executer, verifier in SCENARIOS[nom](repetitions):
+        debut = time.perf_counter()
+        executer()
+        temps.append((time.perf_counter() - debut) * 1000)
+        _verifier(at)
+        verifier(at)
+
+    # Passe séparée sous tracemalloc (qui ralentit fortement l'exécution)
+    allocations = []
+    tracemalloc.start()
+    try:
+        for i, (at, executer, _) in enumerate(SCENARIOS[nom](repetitions)):
+            if i >= 5:
+                break
+            courant, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            executer()
+            _, pic = tracemalloc.get_traced_memory()
+            allocations.append((pic - courant) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "executions": len(temps),
+        "p50_ms": round(centile(temps, 50), 2),
+        "p95_ms": round(centile(temps, 95), 2),
+        "p99_ms": round(centile(temps, 99), 2),
+        "alloc_pic_kio": round(centile(allocations, 50), 1),
+    }
+
+
+def comparer(resultats: dict, reference: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for nom, mesure in resultats.items():
+        ref = reference.get(nom)
+        if not ref:
+            continue
+        for cle in ("p50_ms", "p95_ms"):
+            limite = ref[cle] * (1 + tolerance)
+            if mesure[cle] > limite:
+                regressions.append(
+                    f"{nom}.{cle} : {mesure[cle]:.1f} ms > {limite:.1f} ms "
+                    f"(référence {ref[cle]:.1f} ms + {tolerance:.0%})"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Banc de mesure des reruns de app.py.")
+    parser.add_argument("--repetitions", type=int, default=None,
+                        help="exécutions par scénario (calcul : 60 par tranche de 20 ; "
+                             f"défaut : 40, {REPETITIONS_REFERENCE} avec --enregistrer)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="scénario à mesurer (répétable ; défaut : tous)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="dépassement admis sur p50 / p95 (défaut : 0.25 = +25 %%)")
+    parser.add_argument("--enregistrer", action="store_true",
+                        help=f"écrit les résultats comme nouvelle référence ({REFERENCE})")
+    args = parser.parse_args(argv)
+    if args.repetitions is None:
+        args.repetitions = REPETITIONS_REFERENCE if args.enregistrer else 40
+
+    # app.py cherche assets/ relativement au répertoire courant
+    os.chdir(RACINE)
+    resultats = {}
+    print(f"{'scénario':<20}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'alloc Kio':>12}")
+    # Devis des scénarios journalisés dans un fichier temporaire, pas dans journal/
+    with tempfile.TemporaryDirectory() as dossier:
+        os.environ["UMBRELLA_JOURNAL_DEVIS"] = os.path.join(dossier, "devis.jsonl")
+        for nom in args.scenario or SCENARIOS:
+            m = resultats[nom] = mesurer(nom, args.repetitions)
+            print(f"{nom:<20}{m['executions']:>5}{m['p50_ms']:>10.1f}{m['p95_ms']:>10.1f}"
+                  f"{m['p99_ms']:>10.1f}{m['alloc_pic_kio']:>12.1f}")
+        journal_devis().fermer()
+
+    if args.enregistrer:
+        reference = {}
+        if os.path.exists(REFERENCE):
+            with open(REFERENCE, encoding="utf-8") as f:
+                reference = json.load(f)
+        reference.update(resultats)
+        with open(REFERENCE, "w", encoding="utf-8") as f:
+            json.dump(reference, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Référence enregistrée : {REFERENCE}")
+        return 0
+
+    if not os.path.exists(REFERENCE):
+        print("Aucune référence : lancer avec --enregistrer pour en créer une.")
+        return 0
+    with open(REFERENCE, encoding="utf-8") as f:
+        regressions = comparer(resultats, json.load(f), args.tolerance)
+    for r in regressions:
+        print(f"RÉGRESSION  {r}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""Test de charge : sessions Streamlit simultanées sur le protocole websocket.
+
+Usage :
+    python benchmarks/charge_sessions.py                          # paliers 1,5,10,25,50
+    python benchmarks/charge_sessions.py --paliers 10,50,100 --duree 60
+    python benchmarks/charge_sessions.py --url http://hote:8501/ --pid 4242
+
+Démarre `streamlit run app.py` sur un port libre (ou vise --url), puis ouvre
+à chaque palier N sessions simulées sur /_stcore/stream, comme autant de
+navigateurs (BackMsg / ForwardMsg protobuf). Chaque session enchaîne des
+parcours de visiteur jusqu'à la fin du palier :
+    chargement  nouvelle connexion, première exécution de la page
+    calcul      prénom, âge et zone tirés au hasard, clic sur le bouton
+                (rerun du fragment calculateur)
+    contact     clic sur « Contact » (rerun du fragment, boîte de dialogue)
+avec une pause de réflexion aléatoire (--pause) entre deux actions.
+
+Par palier : reruns terminés par seconde, p50 / p99 de la latence vue du
+client (envoi du BackMsg → script_finished) par étape, erreurs, et côté
+serveur pic de RSS et CPU moyen (psutil). Un parcours
+d'échauffement précède le premier palier (grille, caches, ressources).
+
+Le serveur démarré ici journalise les devis simulés dans un fichier
+temporaire (UMBRELLA_JOURNAL_DEVIS), jamais dans journal/devis.jsonl ; un
+serveur visé par --url doit être lancé avec son propre journal.
+
+Dépendances (requirements-dev.txt) : websockets, requis, vérifié au
+démarrage ; psutil, sans lequel les colonnes RSS / CPU restent vides.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(RACINE, "app.py")
+
+sys.path.insert(0, RACINE)
+from actuariat import AGE_MAX, AGE_MIN  # noqa: E402
+from bench_reruns import centile  # noqa: E402
+from calculateur import ZONES  # noqa: E402
+
+PALIERS = (1, 5, 10, 25, 50)
+DUREE   = 30     # secondes par palier
+PAUSE   = 1.0    # secondes, pause de réflexion moyenne entre deux actions
+DELAI   = 30     # secondes, attente maximale d'un rerun
+ETAPES  = ("chargement", "calcul", "contact")
+
+PRENOMS = ("Marie-Claire", "Jean", "Françoise", "Michel", "Monique", "Alain", "Josette", "Bernard")
+
+
+class ErreurSession(Exception):
+    pass
+
+
+# ─────────────────────────────────────────────
+# SERVEUR
+# ─────────────────────────────────────────────
+def port_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def attendre_serveur(url: str, delai: float = 60) -> None:
+    limite = time.monotonic() + delai
+    while True:
+        try:
+            with urllib.request.urlopen(url.rstrip("/") + "/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return
+        except OSError:
+            pass
+        if time.monotonic() > limite:
+            raise ErreurSession(f"serveur injoignable après {delai:.0f} s : {url}")
+        time.sleep(0.2)
+
+
+def demarrer_serveur(port: int, journal: str) -> subprocess.Popen:
+    """`streamlit run app.py` avec les devis journalisés dans `journal`."""
+    return subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", SCRIPT,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=RACINE, env={**os.environ, "UMBRELLA_JOURNAL_DEVIS": journal},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+class Moniteur:
+    """Pic de RSS et CPU moyen d'un processus serveur (et de ses enfants) pendant un palier."""
+
+    def __init__(self, pid: int | None):
+        self.processus = None
+        if pid is not None:
+            try:
+                import psutil
+            except ImportError:
+                print("psutil absent (requirements-dev.txt) : mesures RSS / CPU du serveur désactivées",
+                      file=sys.stderr)
+            else:
+                self.processus = psutil.Process(pid)
+        self.rss_max = 0
+        self._cpu_debut = 0.0
+        self._debut = 0.0
+
+    def _famille(self):
+        return [self.processus, *self.processus.children(recursive=True)]
+
+    def demarrer(self):
+        if self.processus:
+            self.rss_max = 0
+            self._cpu_debut = sum(sum(p.cpu_times()[:2]) for p in self._famille())
+            self._debut = time.monotonic()
+
+    def echantillonner(self):
+        if self.processus:
+            self.rss_max = max(self.rss_max, sum(p.memory_info().rss for p in self._famille()))
+
+    def resultat(self) -> dict:
+        if not self.processus:
+            return {"rss_max_mio": None, "cpu_pct": None}
+        cpu = sum(sum(p.cpu_times()[:2]) for p in self._famille()) - self._cpu_debut
+        return {
+            "rss_max_mio": round(self.rss_max / 2**20, 1),
+            "cpu_pct": round(100 * cpu / (time.monotonic() - self._debut), 1),
+        }
+
+    async def surveiller(self, arret: asyncio.Event, periode: float = 0.5):
+        while not arret.is_set():
+            self.echantillonner()
+            try:
+                await asyncio.wait_for(arret.wait(), periode)
+            except asyncio.TimeoutError:
+                pass
+
+
+# ─────────────────────────────────────────────
+# SESSION SIMULÉE
+# ─────────────────────────────────────────────
+class Session:
+    """Une connexion websocket qui joue le rôle du navigateur."""
+
+    def __init__(self, url: str, delai: float = DELAI):
+        parties = urlsplit(url)
+        schema = "wss" if parties.scheme == "https" else "ws"
+        self.url_ws = f"{schema}://{parties.netloc}{parties.path.rstrip('/')}/_stcore/stream"
+        self.origine = f"{parties.scheme}://{parties.netloc}"
+        self.delai = delai
+        self.ws = None
+        self.widgets = {}       # clé ou libellé → (id du widget, id du fragment)
+        self.etats = {}         # id du widget → WidgetState envoyé à chaque rerun
+
+    async def ouvrir(self):
+        import websockets
+        self.ws = await websockets.connect(
+            self.url_ws, subprotocols=["streamlit"], origin=self.origine, max_size=None,
+        )
+
+    async def fermer(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, fragment_id: str = "", declencheur: str | None = None) -> float:
+        """Envoie un rerun_script et attend script_finished ; retourne la latence (ms)."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.fragment_id = fragment_id
+        for etat in self.etats.values():
+            msg.rerun_script.widget_states.widgets.append(etat)
+        if declencheur is not None:
+            bouton = msg.rerun_script.widget_states.widgets.add()
+            bouton.id = declencheur
+            bouton.trigger_value = True
+
+        debut = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        limite = time.monotonic() + self.delai
+        while True:
+            try:
+                brut = await asyncio.wait_for(self.ws.recv(), max(limite - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                raise ErreurSession(f"pas de script_finished après {self.delai:.0f} s") from None
+            fwd = ForwardMsg()
+            fwd.ParseFromString(brut)
+            type_msg = fwd.WhichOneof("type")
+            if type_msg == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._noter_element(fwd.delta.new_element, fwd.delta.fragment_id)
+            elif type_msg == "script_finished":
+                if fwd.script_finished not in (
+                    ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY
+                ):
+                    raise ErreurSession(f"exécution interrompue (code {fwd.script_finished})")
+                return (time.perf_counter() - debut) * 1000
+
+    def _noter_element(self, element, fragment_id: str):
+        type_element = element.WhichOneof("type")
+        if type_element == "exception":
+            raise ErreurSession(f"exception dans app.py : {element.exception.message}")
+        widget = getattr(element, type_element)
+        identifiant = getattr(widget, "id", "")
+        if identifiant.startswith("$$ID-"):
+            cle = identifiant.rsplit("-", 1)[1]
+            self.widgets[widget.label if cle == "None" else cle] = (identifiant, fragment_id)
+
+    def _valeur(self, cle: str, champ: str, valeur):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        etat = WidgetState(id=self.widgets[cle][0])
+        setattr(etat, champ, valeur)
+        self.etats[etat.id] = etat
+
+    def _bouton(self, cle: str) -> tuple[str, str]:
+        for nom, (identifiant, fragment_id) in self.widgets.items():
+            if nom == cle or nom.startswith(cle):
+                return identifiant, fragment_id
+        raise ErreurSession(f"bouton introuvable : {cle}")
+
+    async def charger(self) -> float:
+        await self.ouvrir()
+        return await self.rerun()
+
+    async def calculer(self, rng: random.Random) -> float:
+        self._valeur("devis_nom", "string_value", rng.choice(PRENOMS))
+        self._valeur("devis_age", "int_value", rng.randint(AGE_MIN, AGE_MAX))
+        self._valeur("devis_zone", "string_value", rng.choice(ZONES))
+        identifiant, fragment_id = self._bouton("btn_calculer")
+        return await self.rerun(fragment_id, declencheur=identifiant)
+
+    async def contacter(self) -> float:
+        identifiant, fragment_id = self._bouton("btn_contact")
+        return await self.rerun(fragment_id, declencheur=identifiant)
+
+
+async def parcours(url: str, rng: random.Random, pause: float, mesures: dict, delai: float = DELAI):
+    """Un visiteur : chargement, calcul, contact ; latences ajoutées à `mesures`."""
+    session = Session(url, delai)
+    try:
+        mesures["chargement"].append(await session.charger())
+        await asyncio.sleep(rng.uniform(0, 2 * pause))
+        mesures["calcul"].append(await session.calculer(rng))
+        await asyncio.sleep(rng.uniform(0, 2 * pause))
+        mesures["contact"].append(await session.contacter())
+    finally:
+        await session.fermer()
+
+
+# ─────────────────────────────────────────────
+# PALIERS
+# ─────────────────────────────────────────────
+async def palier(url: str, sessions: int, duree: float, pause: float, graine: int,
+                 moniteur: Moniteur, delai: float = DELAI) -> dict:
+    mesures = {etape: [] for etape in ETAPES}
+    erreurs = []
+    fin = time.monotonic() + duree
+
+    async def visiteur(index: int):
+        rng = random.Random(graine * 100_003 + index)
+        # Arrivées étalées sur la première pause, pas toutes à la même milliseconde
+        await asyncio.sleep(rng.uniform(0, pause))
+        while time.monotonic() < fin:
+            try:
+                await parcours(url, rng, pause, mesures, delai)
+            except (ErreurSession, OSError) as e:
+                erreurs.append(str(e))
+            except Exception as e:   # fermeture websocket côté serveur, etc.
+                erreurs.append(f"{type(e).__name__} : {e}")
+
+    arret = asyncio.Event()
+    moniteur.demarrer()
+    surveillance = asyncio.create_task(moniteur.surveiller(arret))
+    debut = time.monotonic()
+    await asyncio.gather(*(visiteur(i) for i in range(sessions)))
+    ecoule = time.monotonic() - debut
+    arret.set()
+    await surveillance
+
+    reruns = sum(len(v) for v in mesures.values())
+    resultat = {
+        "sessions": sessions,
+        "duree_s": round(ecoule, 1),
+        "parcours": len(mesures["contact"]),
+        "reruns_par_s": round(reruns / ecoule, 1),
+        "erreurs": len(erreurs),
+        **{
+            f"{etape}_{cle}_ms": round(centile(v, p), 1) if v else None
+            for etape, v in mesures.items() for cle, p in (("p50", 50), ("p99", 99))
+        },
+        **moniteur.resultat(),
+    }
+    if erreurs:
+        resultat["premiere_erreur"] = erreurs[0]
+    return resultat
+
+
+def _cellule(valeur, largeur: int, format_: str = ".1f") -> str:
+    return f"{'—':>{largeur}}" if valeur is None else f"{valeur:>{largeur}{format_}}"
+
+
+def afficher_entete():
+    etapes = "".join(f"{e + ' p50':>16}{e + ' p99':>16}" for e in ETAPES)
+    print(f"{'sessions':>8}{'reruns/s':>10}{'erreurs':>9}{etapes}{'RSS Mio':>10}{'CPU %':>8}")
+
+
+def afficher_palier(r: dict):
+    etapes = "".join(
+        _cellule(r[f"{e}_p50_ms"], 16) + _cellule(r[f"{e}_p99_ms"], 16) for e in ETAPES
+    )
+    print(f"{r['sessions']:>8}{r['reruns_par_s']:>10.1f}{r['erreurs']:>9}{etapes}"
+          f"{_cellule(r['rss_max_mio'], 10)}{_cellule(r['cpu_pct'], 8)}", flush=True)
+
+
+async def campagne(url: str, paliers, duree: float, pause: float, graine: int,
+                   moniteur: Moniteur, delai: float = DELAI) -> list[dict]:
+    # Échauffement : grille, caches et ressources publiées avant la première mesure
+    await parcours(url, random.Random(graine), 0, {e: [] for e in ETAPES}, delai)
+    afficher_entete()
+    resultats = []
+    for sessions in paliers:
+        r = await palier(url, sessions, duree, pause, graine, moniteur, delai)
+        afficher_palier(r)
+        resultats.append(r)
+    return resultats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Test de charge de app.py : sessions Streamlit simultanées.")
+    parser.add_argument("--paliers", default=",".join(map(str, PALIERS)),
+                        help=f"nombres de sessions simultanées, séparés par des virgules (défaut : "
+                             f"{','.join(map(str, PALIERS))})")
+    parser.add_argument("--duree", type=float, default=DUREE, help=f"secondes par palier (défaut : {DUREE})")
+    parser.add_argument("--pause", type=float, default=PAUSE,
+                        help=f"pause de réflexion moyenne entre deux actions, s (défaut : {PAUSE})")
+    parser.add_argument("--delai", type=float, default=DELAI,
+                        help=f"attente maximale d'un rerun, s (défaut : {DELAI})")
+    parser.add_argument("--graine", type=int, default=0, help="graine des tirages (défaut : 0)")
+    parser.add_argument("--url", help="serveur déjà démarré (défaut : lance streamlit run app.py)")
+    parser.add_argument("--pid", type=int, help="PID du serveur visé par --url, pour RSS / CPU")
+    parser.add_argument("--json", help="écrit aussi les résultats dans ce fichier")
+    args = parser.parse_args(argv)
+
+    try:
+        paliers = [int(n) for n in args.paliers.split(",") if n.strip()]
+        if not paliers or min(paliers) < 1:
+            raise ValueError
+    except ValueError:
+        print(f"Erreur : paliers invalides : {args.paliers}", file=sys.stderr)
+        return 1
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        print("Erreur : le test de charge requiert websockets (pip install -r requirements-dev.txt)",
+              file=sys.stderr)
+        return 1
+
+    serveur = temporaire = None
+    url, pid = args.url, args.pid
+    if url is None:
+        temporaire = tempfile.TemporaryDirectory()
+        port = port_libre()
+        serveur = demarrer_serveur(port, os.path.join(temporaire.name, "devis.jsonl"))
+        url, pid = f"http://127.0.0.1:{port}/", serveur.pid
+    try:
+        attendre_serveur(url)
+        resultats = asyncio.run(campagne(
+            url, paliers, args.duree, args.pause, args.graine, Moniteur(pid), args.delai
+        ))
+    except (ErreurSession, OSError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    finally:
+        if serveur is not None:
+            serveur.terminate()
+            serveur.wait(timeout=10)
+            temporaire.cleanup()
+
+    for r in resultats:
+        if "premiere_erreur" in r:
+            print(f"{r['sessions']} sessions, {r['erreurs']} erreur(s) : {r['premiere_erreur']}", file=sys.stderr)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return 1 if any(r["erreurs"] for r in resultats) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
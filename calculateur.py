@@ -0,0 +1,119 @@
+"""Calculateur de prime : formulaire, calcul et carte de résultat.
+
+Rendu dans la page complète (app.py, section 10b) ou seul avec
+?vue=calculateur, pour l'intégration en iframe dans la page statique
+produite par export_statique.py.
+"""
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from actuariat import GrilleTarifaire, construire_grille
+from journal_devis import evenement_devis, journal_devis
+from sections import entete
+
+
+@st.cache_resource
+def charger_grille() -> GrilleTarifaire:
+    """Grille tarifaire construite une fois par processus, partagée par toutes les sessions."""
+    return construire_grille()
+
+
+ZONES = [
+    "Grande ville / Zone urbaine (densité médicale forte)",
+    "Zone rurale / Petite ville (densité médicale faible)",
+]
+
+
+def _calculer_devis():
+    """Callback du bouton : calcule le devis à partir des widgets du formulaire."""
+    nom = st.session_state.devis_nom.strip()
+    if not nom:
+        st.session_state.devis_resultat = "erreur"
+        return
+    age = st.session_state.devis_age
+    densite = 'forte' if 'forte' in st.session_state.devis_zone else 'faible'
+    devis = charger_grille().devis(age, densite)
+    st.session_state.devis_resultat = (nom, age, densite, *devis)
+    # Journalisé en arrière-plan : ne fait que déposer l'événement dans une file
+    ctx = get_script_run_ctx()
+    journal_devis().enregistrer(
+        evenement_devis(age, densite, *devis, session=ctx.session_id if ctx else None)
+    )
+
+
+# Fragment : une interaction avec le calculateur ne réexécute que cette
+# section, pas la page entière
+@st.fragment
+def calculateur():
+    col_l, col_form, col_r = st.columns([1, 2, 1])
+    with col_form:
+        with st.container(border=True):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.text_input("👤 Votre Prénom", placeholder="ex : Marie-Claire", key="devis_nom")
+            with col2:
+                st.number_input(
+                    "🎂 Votre Âge",
+                    min_value=65, max_value=94, value=70,
+                    help="Notre offre Santé Senior est disponible de 65 à 94 ans.",
+                    key="devis_age",
+                )
+
+            st.selectbox(
+                "📍 Votre zone géographique",
+                ZONES,
+                help="La densité médicale de votre zone influence le calcul de votre prime.",
+                key="devis_zone",
+            )
+
+            st.write("")
+            st.button(
+                "CALCULER MA PRIME GRATUITE", use_container_width=True,
+                key="btn_calculer", on_click=_calculer_devis,
+            )
+
+        # Résultat affiché une seule fois, comme le retour du bouton auparavant
+        resultat = st.session_state.pop("devis_resultat", None)
+        if resultat == "erreur":
+            st.error("⚠️ Merci de renseigner votre prénom pour obtenir votre devis personnalisé.")
+        elif resultat:
+            nom, age, densite, prime_pure, chargements, prime_com = resultat
+            # Projection à tarif constant : une tranche du cube précalculé
+            ages_projetes, _, cumul = charger_grille().projection(age, densite)
+            st.balloons()
+            st.markdown(f"""
+<div class="result-card">
+  <div class="result-name">Offre personnalisée pour {nom}</div>
+  <div class="result-price">{prime_com:.2f} <span>€ / an</span></div>
+  <div class="result-breakdown">
+    <div class="breakdown-item">
+      <span class="breakdown-label">Prime pure</span>
+      <span class="breakdown-val">{prime_pure:.2f} €</span>
+    </div>
+    <div class="breakdown-item">
+      <span class="breakdown-label">Chargements</span>
+      <span class="breakdown-val">{chargements:.2f} €</span>
+    </div>
+    <div class="breakdown-item">
+      <span class="breakdown-label">Taux de frais</span>
+      <span class="breakdown-val">{charger_grille().taux_frais * 100:.0f} %</span>
+    </div>
+    <div class="breakdown-item">
+      <span class="breakdown-label">Zone</span>
+      <span class="breakdown-val">Densité {'forte' if densite == 'forte' else 'faible'}</span>
+    </div>
+    <div class="breakdown-item">
+      <span class="breakdown-label">Coût cumulé jusqu'à {ages_projetes[-1]} ans</span>
+      <span class="breakdown-val">{cumul[-1]:.2f} €</span>
+    </div>
+  </div>
+</div>
+""", unsafe_allow_html=True)
+            st.info("📞 Un conseiller Umbrella vous rappelle sous 24h pour finaliser votre contrat.")
+
+
+def afficher_calculateur(avec_entete: bool = True):
+    if avec_entete:
+        st.markdown('<div id="devis"></div>', unsafe_allow_html=True)
+        st.markdown(entete("devis"), unsafe_allow_html=True)
+    calculateur()
@@ -0,0 +1,273 @@
+"""Compaction colonnaire du journal des devis et requêtes sans relire le JSON.
+
+Usage :
+    python compaction_devis.py compacter [--dossier journal] [--supprimer]
+    python compaction_devis.py requete --age 80 --densite faible --depuis 2026-10-11
+
+`compacter` convertit chaque segment clos devis.<horodatage>.jsonl (voir
+journal_devis.py) en un fichier devis.<horodatage>.col : un en-tête JSON
+(nombre de lignes, position de chaque colonne, min / max d'horodatage et
+d'âge) suivi des colonnes binaires, alignées et triées par horodatage.
+Le fichier actif devis.jsonl n'est jamais touché.
+
+Les requêtes ouvrent les colonnes avec np.memmap : seuls les segments dont
+les min / max recoupent les filtres sont lus, la plage de temps est trouvée
+par recherche dichotomique sur la colonne triée, et le reste est parcouru
+par blocs. Ni analyse JSON, ni chargement complet d'un fichier en mémoire.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import struct
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+from actuariat import AGE_MAX, AGE_MIN, DENSITES, indices_densite
+from journal_devis import CHEMIN_JOURNAL
+
+MAGIC       = b"UMBDEVC1"
+ALIGNEMENT  = 64
+TAILLE_BLOC = 1 << 20     # lignes parcourues à la fois par les requêtes
+
+# Colonnes stockées : horodatage en µs UTC, densité en code 0 = forte / 1 = faible
+COLONNES = (
+    ("horodatage_us", "<i8"),
+    ("age", "u1"),
+    ("densite", "u1"),
+    ("prime_pure", "<f8"),
+    ("chargements", "<f8"),
+    ("prime_commerciale", "<f8"),
+)
+
+_RE_SEGMENT = re.compile(r"\.\d{8}T\d{6}_\d{6}\.jsonl$")
+
+
+def _aligner(n: int) -> int:
+    return -(-n // ALIGNEMENT) * ALIGNEMENT
+
+
+def _microsecondes(horodatage: str) -> int:
+    dt = datetime.fromisoformat(horodatage)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
+
+# ─────────────────────────────────────────────
+# COMPACTION
+# ─────────────────────────────────────────────
+def segments_jsonl(dossier: str) -> list[str]:
+    """Segments clos (renommés par la rotation), du plus ancien au plus récent."""
+    return sorted(
+        f for f in glob.glob(os.path.join(dossier, "*.jsonl")) if _RE_SEGMENT.search(f)
+    )
+
+
+def compacter_segment(source: str, destination: str | None = None) -> str:
+    """Écrit la version colonnaire de `source` et retourne son chemin."""
+    destination = destination or source[:-len(".jsonl")] + ".col"
+    colonnes = {nom: [] for nom, _ in COLONNES}
+    with open(source, encoding="utf-8") as f:
+        for ligne in f:
+            if not ligne.strip():
+                continue
+            e = json.loads(ligne)
+            colonnes["horodatage_us"].append(_microsecondes(e["horodatage"]))
+            colonnes["age"].append(e["age"])
+            colonnes["densite"].append(e["densite"])
+            colonnes["prime_pure"].append(e["prime_pure"])
+            colonnes["chargements"].append(e["chargements"])
+            colonnes["prime_commerciale"].append(e["prime_commerciale"])
+
+    colonnes["densite"] = indices_densite(np.array(colonnes["densite"], dtype=str))
+    tableaux = {nom: np.asarray(colonnes[nom]).astype(dtype) for nom, dtype in COLONNES}
+    ordre = np.argsort(tableaux["horodatage_us"], kind="stable")
+    tableaux = {nom: t[ordre] for nom, t in tableaux.items()}
+    n = len(ordre)
+
+    # Positions relatives à la fin de l'en-tête, qui n'est connue qu'ensuite
+    positions, position = {}, 0
+    for nom, dtype in COLONNES:
+        positions[nom] = position
+        position = _aligner(position + n * np.dtype(dtype).itemsize)
+    temps, ages = tableaux["horodatage_us"], tableaux["age"]
+    entete = {
+        "lignes": n,
+        "colonnes": [{"nom": nom, "dtype": dtype, "position": positions[nom]} for nom, dtype in COLONNES],
+        "horodatage_min": int(temps[0]) if n else None,
+        "horodatage_max": int(temps[-1]) if n else None,
+        "age_min": int(ages.min()) if n else None,
+        "age_max": int(ages.max()) if n else None,
+    }
+    brut = json.dumps(entete, separators=(",", ":")).encode()
+    debut_donnees = _aligner(len(MAGIC) + 4 + len(brut))
+
+    tmp = f"{destination}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(brut)) + brut)
+        for nom, _ in COLONNES:
+            f.seek(debut_donnees + positions[nom])
+            f.write(tableaux[nom].tobytes())
+        f.truncate(debut_donnees + position)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, destination)
+    return destination
+
+
+def compacter(dossier: str, supprimer: bool = False) -> list[str]:
+    """Compacte les segments clos non encore convertis ; retourne les fichiers écrits."""
+    ecrits = []
+    for source in segments_jsonl(dossier):
+        destination = source[:-len(".jsonl")] + ".col"
+        if not os.path.exists(destination):
+            ecrits.append(compacter_segment(source, destination))
+        if supprimer:
+            os.remove(source)
+    return ecrits
+
+
+# ─────────────────────────────────────────────
+# LECTURE (np.memmap)
+# ─────────────────────────────────────────────
+@dataclass(frozen=True)
+class Segment:
+    chemin: str
+    lignes: int
+    horodatage_min: int | None
+    horodatage_max: int | None
+    age_min: int | None
+    age_max: int | None
+    _positions: tuple
+
+    def colonne(self, nom: str) -> np.memmap:
+        """Colonne projetée en mémoire (lecture seule, pages chargées à la demande)."""
+        debut, dtype = dict(self._positions)[nom]
+        return np.memmap(self.chemin, dtype=dtype, mode="r", offset=debut, shape=(self.lignes,))
+
+    def recoupe(self, ages: tuple[int, int], debut: int | None, fin: int | None) -> bool:
+        if not self.lignes:
+            return False
+        if self.age_max < ages[0] or self.age_min > ages[1]:
+            return False
+        if debut is not None and self.horodatage_max < debut:
+            return False
+        return fin is None or self.horodatage_min < fin
+
+
+@lru_cache(maxsize=1024)
+def _lire_segment(chemin: str, mtime_ns: int) -> Segment:
+    with open(chemin, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{chemin} : pas un segment colonnaire de devis")
+        (longueur,) = struct.unpack("<I", f.read(4))
+        entete = json.loads(f.read(longueur))
+    debut_donnees = _aligner(len(MAGIC) + 4 + longueur)
+    positions = tuple(
+        (c["nom"], (debut_donnees + c["position"], np.dtype(c["dtype"]))) for c in entete["colonnes"]
+    )
+    return Segment(
+        chemin, entete["lignes"], entete["horodatage_min"], entete["horodatage_max"],
+        entete["age_min"], entete["age_max"], positions,
+    )
+
+
+def segments(dossier: str) -> list[Segment]:
+    """En-têtes des segments colonnaires du dossier (mis en cache tant que le fichier ne change pas)."""
+    return [
+        _lire_segment(chemin, os.stat(chemin).st_mtime_ns)
+        for chemin in sorted(glob.glob(os.path.join(dossier, "*.col")))
+    ]
+
+
+# ─────────────────────────────────────────────
+# REQUÊTES
+# ─────────────────────────────────────────────
+def requete(
+    dossier: str,
+    ages: tuple[int, int] = (AGE_MIN, AGE_MAX),
+    densite: str | None = None,
+    debut: datetime | None = None,
+    fin: datetime | None = None,
+) -> dict:
+    """Nombre de devis, somme et moyenne de la prime commerciale, et répartition
+    par âge, pour les devis d'âge dans `ages` (bornes incluses), de densité
+    donnée et d'horodatage dans [debut, fin[."""
+    code = None if densite is None else int(indices_densite([densite])[0])
+    debut_us = None if debut is None else _microsecondes(debut.isoformat())
+    fin_us = None if fin is None else _microsecondes(fin.isoformat())
+
+    n, somme = 0, 0.0
+    par_age = np.zeros(AGE_MAX + 1, dtype=np.int64)
+    for segment in segments(dossier):
+        if not segment.recoupe(ages, debut_us, fin_us):
+            continue
+        temps = segment.colonne("horodatage_us")
+        i = 0 if debut_us is None else int(np.searchsorted(temps, debut_us, "left"))
+        j = segment.lignes if fin_us is None else int(np.searchsorted(temps, fin_us, "left"))
+        col_age = segment.colonne("age")
+        col_densite = segment.colonne("densite")
+        col_prime = segment.colonne("prime_commerciale")
+        for bloc in range(i, j, TAILLE_BLOC):
+            tranche = slice(bloc, min(bloc + TAILLE_BLOC, j))
+            age = col_age[tranche]
+            masque = (age >= ages[0]) & (age <= ages[1])
+            if code is not None:
+                masque &= col_densite[tranche] == code
+            n += int(np.count_nonzero(masque))
+            somme += float(col_prime[tranche][masque].sum())
+            par_age += np.bincount(age[masque], minlength=AGE_MAX + 1)
+    return {
+        "devis": n,
+        "prime_commerciale_totale": round(somme, 2),
+        "prime_commerciale_moyenne": round(somme / n, 2) if n else None,
+        "par_age": {a: int(par_age[a]) for a in range(AGE_MIN, AGE_MAX + 1) if par_age[a]},
+    }
+
+
+def _date(texte: str) -> datetime:
+    dt = datetime.fromisoformat(texte)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compaction et requêtes du journal des devis.")
+    sous = parser.add_subparsers(dest="commande", required=True)
+    dossier_defaut = os.path.dirname(os.environ.get("UMBRELLA_JOURNAL_DEVIS", CHEMIN_JOURNAL))
+
+    p = sous.add_parser("compacter", help="convertit les segments clos en fichiers colonnaires")
+    p.add_argument("--dossier", default=dossier_defaut, help=f"défaut : {dossier_defaut}")
+    p.add_argument("--supprimer", action="store_true",
+                   help="supprime chaque segment JSONL une fois converti")
+
+    p = sous.add_parser("requete", help="compte et agrège les devis compactés")
+    p.add_argument("--dossier", default=dossier_defaut, help=f"défaut : {dossier_defaut}")
+    p.add_argument("--age", type=int, nargs="+", metavar="AGE",
+                   help="un âge, ou deux bornes incluses (défaut : tous)")
+    p.add_argument("--densite", choices=DENSITES)
+    p.add_argument("--depuis", type=_date, help="date ISO (incluse), UTC par défaut")
+    p.add_argument("--jusqua", type=_date, help="date ISO (exclue), UTC par défaut")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.commande == "compacter":
+            for chemin in compacter(args.dossier, args.supprimer):
+                print(chemin)
+            return 0
+        ages = (AGE_MIN, AGE_MAX) if not args.age else (args.age[0], args.age[-1])
+        resultat = requete(args.dossier, ages, args.densite, args.depuis, args.jusqua)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(resultat, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Contenu éditorial de la page d'accueil, lu dans un fichier de données.
+
+Source (UMBRELLA_CONTENU, sinon donnees/contenu.json), objet JSON :
+
+    hero          badge, titre, sous_titre, action_principale / action_secondaire
+                  ({texte, lien}), confiance ([{icone, titre, texte}])
+    entetes       titre et sous-titre des sections solutions, howto, devis,
+                  temoignages et faq
+    solutions     cartes {icon, titre, desc, featured?, badge?}
+    howto         étapes {num, titre, desc}
+    temoignages   avis {stars (0 à 5), text, initiale, nom, info}
+    faq           [{question, reponse}], réponses en Markdown
+
+Les textes sont insérés tels quels dans le HTML de la page (balises et
+entités admises, caractères accentués en clair).
+
+Le fichier n'est relu que si son mtime change : charger_contenu() coûte un
+os.stat par appel, et une modification est servie dès le rerun suivant, sans
+redémarrer le serveur. L'empreinte SHA-256 du fichier identifie le contenu :
+les fragments HTML compilés (sections.py) ne sont reconstruits que si elle
+change. Un fichier modifié mais invalide est signalé une fois sur la sortie
+d'erreur et le dernier contenu valide reste servi.
+"""
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from ressources import RACINE, empreinte_fichier
+
+CHEMIN_CONTENU = os.path.join(RACINE, "donnees", "contenu.json")
+
+CHAMPS_HERO = ("badge", "titre", "sous_titre", "action_principale", "action_secondaire", "confiance")
+SECTIONS    = ("solutions", "howto", "devis", "temoignages", "faq")
+# liste → (champs obligatoires de chaque élément, valeurs par défaut)
+CHAMPS_LISTES = {
+    "solutions": (("icon", "titre", "desc"), {"featured": False, "badge": None}),
+    "howto": (("num", "titre", "desc"), {}),
+    "temoignages": (("stars", "text", "initiale", "nom", "info"), {}),
+    "faq": (("question", "reponse"), {}),
+}
+
+
+class ErreurContenu(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Contenu:
+    """Contenu validé ; égalité et hash ne portent que sur l'empreinte du fichier."""
+    empreinte: str
+    hero: dict = field(compare=False)
+    entetes: dict[str, dict] = field(compare=False)
+    solutions: tuple[dict, ...] = field(compare=False)
+    howto: tuple[dict, ...] = field(compare=False)
+    temoignages: tuple[dict, ...] = field(compare=False)
+    faq: tuple[tuple[str, str], ...] = field(compare=False)
+    source: str = field(compare=False)
+
+
+# ─────────────────────────────────────────────
+# VALIDATION
+# ─────────────────────────────────────────────
+def _objet(valeur, champs, contexte: str) -> dict:
+    if not isinstance(valeur, dict):
+        raise ErreurContenu(f"{contexte} : objet attendu, lu {type(valeur).__name__}")
+    manquants = [c for c in champs if c not in valeur]
+    if manquants:
+        raise ErreurContenu(f"{contexte} : champ(s) manquant(s) {', '.join(manquants)}")
+    return valeur
+
+
+def _liste(donnees: dict, nom: str, source: str) -> tuple[dict, ...]:
+    champs, defauts = CHAMPS_LISTES[nom]
+    elements = donnees.get(nom)
+    if not isinstance(elements, list) or not elements:
+        raise ErreurContenu(f"{source} : liste « {nom} » absente ou vide")
+    return tuple(
+        {**defauts, **_objet(e, champs, f"{source}, {nom}[{i}]")} for i, e in enumerate(elements)
+    )
+
+
+def valider(donnees, empreinte: str, source: str) -> Contenu:
+    _objet(donnees, ("hero", "entetes", *CHAMPS_LISTES), source)
+    hero = _objet(donnees["hero"], CHAMPS_HERO, f"{source}, hero")
+    for cle in ("action_principale", "action_secondaire"):
+        _objet(hero[cle], ("texte", "lien"), f"{source}, hero.{cle}")
+    if not isinstance(hero["confiance"], list):
+        raise ErreurContenu(f"{source}, hero.confiance : liste attendue")
+    for i, item in enumerate(hero["confiance"]):
+        _objet(item, ("icone", "titre", "texte"), f"{source}, hero.confiance[{i}]")
+    entetes = _objet(donnees["entetes"], SECTIONS, f"{source}, entetes")
+    for nom in SECTIONS:
+        _objet(entetes[nom], ("titre", "sous_titre"), f"{source}, entetes.{nom}")
+    temoignages = _liste(donnees, "temoignages", source)
+    for i, t in enumerate(temoignages):
+        if not isinstance(t["stars"], int) or not 0 <= t["stars"] <= 5:
+            raise ErreurContenu(f"{source}, temoignages[{i}] : « stars » doit être un entier de 0 à 5")
+    return Contenu(
+        empreinte=empreinte,
+        hero=hero,
+        entetes=entetes,
+        solutions=_liste(donnees, "solutions", source),
+        howto=_liste(donnees, "howto", source),
+        temoignages=temoignages,
+        faq=tuple((q["question"], q["reponse"]) for q in _liste(donnees, "faq", source)),
+        source=source,
+    )
+
+
+# ─────────────────────────────────────────────
+# CHARGEMENT (cache du processus)
+# ─────────────────────────────────────────────
+@lru_cache(maxsize=4)
+def _lire(chemin: str, mtime_ns: int) -> Contenu | ErreurContenu:
+    # L'erreur est mise en cache comme un résultat : signalée une fois par version du fichier
+    try:
+        with open(chemin, "rb") as f:
+            brut = f.read()
+        try:
+            donnees = json.loads(brut)
+        except ValueError as e:
+            raise ErreurContenu(f"{chemin} : JSON invalide ({e})") from None
+        return valider(donnees, hashlib.sha256(brut).hexdigest(), chemin)
+    except (ErreurContenu, OSError) as e:
+        erreur = e if isinstance(e, ErreurContenu) else ErreurContenu(f"{chemin} : {e.strerror}")
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return erreur
+
+
+# Dernier contenu valide par fichier, servi tant qu'une modification est invalide
+_valides: dict[str, Contenu] = {}
+
+
+def source_contenu() -> str:
+    return os.environ.get("UMBRELLA_CONTENU") or CHEMIN_CONTENU
+
+
+def charger_contenu(chemin: str | None = None) -> Contenu:
+    """Contenu validé, relu seulement si le fichier a changé depuis le dernier appel."""
+    chemin = os.path.abspath(chemin or source_contenu())
+    try:
+        resultat = _lire(*empreinte_fichier(chemin))
+    except OSError as e:
+        # Fichier momentanément absent (remplacement par un éditeur, déploiement)
+        resultat = ErreurContenu(f"{chemin} : {e.strerror}")
+    if isinstance(resultat, Contenu):
+        _valides[chemin] = resultat
+        return resultat
+    if chemin in _valides:
+        return _valides[chemin]
+    raise resultat
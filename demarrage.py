@@ -0,0 +1,147 @@
+"""Démarrage rapide : caches du processus préchauffés avant la première session.
+
+Usage :
+    python demarrage.py                         # au lieu de : streamlit run app.py
+    python demarrage.py --server.port 8080      # options streamlit transmises telles quelles
+
+Sans préchauffage, le premier visiteur après un déploiement paie la
+construction de la grille tarifaire, la minification / publication de la
+feuille de style et des polices, les variantes du logo et, s'il y a une
+vidéo, sa réécriture faststart et son hash. Ici, dans le processus même du
+serveur et avant son ouverture :
+    - critique (bloquant) : grille, styles, logo, contenu et blocs HTML compilés ;
+    - différé (arrière-plan) : vidéo, photo de la boîte de dialogue Contact.
+Le serveur ne répond donc au contrôle de santé qu'une fois les caches
+chauds. En mode rapide (UMBRELLA_DEMARRAGE_RAPIDE=1, posé par ce lanceur),
+app.py n'attend pas la vidéo : elle apparaît dès qu'elle est prête.
+
+Mesure du démarrage à froid : benchmarks/bench_demarrage.py.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+
+from ressources import RACINE
+
+SCRIPT = os.path.join(RACINE, "app.py")
+
+
+def demarrage_rapide() -> bool:
+    return os.environ.get("UMBRELLA_DEMARRAGE_RAPIDE", "") not in ("", "0")
+
+
+# ─────────────────────────────────────────────
+# TÂCHES DE PRÉCHAUFFAGE
+# ─────────────────────────────────────────────
+def _streamlit():
+    # Importé paresseusement par st.set_page_config (validation de page_icon)
+    # au premier rerun : ~50 ms payés par le premier visiteur sinon
+    import streamlit.emojis  # noqa: F401
+
+
+def _grille():
+    from calculateur import charger_grille
+    # Hors session, st.cache_resource avertit de l'absence de ScriptRunContext :
+    # sans conséquence ici (le cache est celui du processus)
+    journal = logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context")
+    niveau = journal.level
+    journal.setLevel(logging.ERROR)
+    try:
+        charger_grille()
+    finally:
+        journal.setLevel(niveau)
+
+
+def _styles():
+    from polices import balise_styles
+    balise_styles()
+
+
+def _logo():
+    from images import LARGEURS_LOGO, variantes_image
+    from ressources import lire_b64, service_statique_actif, trouver_ressource
+    chemin = trouver_ressource("logo.jpg")
+    if chemin and service_statique_actif():
+        variantes_image(chemin, LARGEURS_LOGO)
+    elif chemin:
+        lire_b64(chemin)
+
+
+def _sections():
+    from sections import BLOCS, bloc_html, hero_html
+    hero_html()
+    for nom in BLOCS:
+        bloc_html(nom)
+
+
+def _video():
+    from video import trouver_video, video_web_differee
+    chemin = trouver_video()
+    if chemin:
+        video_web_differee(chemin)
+
+
+def _photo_contact():
+    from images import variantes_image
+    from ressources import service_statique_actif, trouver_ressource
+    chemin = trouver_ressource("Nous.jpg")
+    if chemin and service_statique_actif():
+        variantes_image(chemin)
+
+
+CRITIQUES = {"streamlit": _streamlit, "grille": _grille, "styles": _styles, "logo": _logo, "sections": _sections}
+DIFFERES = {"vidéo": _video, "photo contact": _photo_contact}
+
+
+def _executer(taches: dict) -> dict[str, float]:
+    durees = {}
+    for nom, tache in taches.items():
+        debut = time.perf_counter()
+        try:
+            tache()
+        except Exception as e:   # le préchauffage ne doit jamais empêcher le démarrage
+            print(f"Préchauffage « {nom} » ignoré : {e}", file=sys.stderr)
+        durees[nom] = (time.perf_counter() - debut) * 1000
+    return durees
+
+
+def prechauffer(attendre_differes: bool = False) -> dict[str, float]:
+    """Exécute les tâches critiques (durées en ms) et lance les tâches différées.
+
+    Les tâches différées tournent dans un thread ; `attendre_differes` le joint
+    (mesures, tests).
+    """
+    durees = _executer(CRITIQUES)
+    fil = threading.Thread(target=_executer, args=(DIFFERES,), name="prechauffage", daemon=True)
+    fil.start()
+    if attendre_differes:
+        fil.join()
+    return durees
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    # app.py cherche assets/ relativement au répertoire courant
+    os.chdir(RACINE)
+    os.environ["UMBRELLA_DEMARRAGE_RAPIDE"] = "1"
+
+    from streamlit import config
+    from streamlit.web.cli import main as streamlit_cli
+
+    def au_demarrage():
+        # Après lecture de la configuration (config.toml + options de la
+        # ligne de commande), avant l'ouverture du serveur
+        debut = time.perf_counter()
+        durees = prechauffer()
+        detail = ", ".join(f"{nom} {ms:.0f} ms" for nom, ms in durees.items())
+        print(f"Caches préchauffés en {(time.perf_counter() - debut) * 1000:.0f} ms ({detail})",
+              file=sys.stderr)
+
+    config.on_config_parsed(au_demarrage, force_connect=True)
+    return streamlit_cli(["run", SCRIPT, *argv], prog_name="streamlit", standalone_mode=False) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""Tarification en masse d'un fichier de prospects (CSV ou JSONL).
+
+Usage :
+    python devis_masse.py prospects.csv devis.csv
+    python devis_masse.py prospects.jsonl devis.jsonl --processus 8
+
+Chaque prospect porte un nom, un âge et une zone ('forte' / 'faible', ou un
+libellé contenant « urbain » / « rural »). Le fichier est lu par lots de
+taille fixe : la mémoire reste stable quelle que soit la taille du fichier.
+Au-delà de --seuil-parallele Mo, les lots sont répartis sur un pool de
+processus ; l'ordre des lignes est conservé en sortie.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+import numpy as np
+
+from actuariat import AGE_MAX, AGE_MIN, calcul_primes_vectorise
+
+TAILLE_LOT      = 50_000
+SEUIL_PARALLELE = 64      # Mo
+COLONNES_SORTIE = [
+    "nom", "age", "zone", "densite",
+    "prime_pure", "chargements", "prime_commerciale", "erreur",
+]
+
+# Libellés de zone acceptés → densité médicale
+_MOTS_ZONE = (
+    ("faible", "faible"), ("rural", "faible"), ("petite ville", "faible"),
+    ("forte", "forte"), ("urbain", "forte"), ("grande ville", "forte"),
+)
+
+
+def densite_depuis_zone(zone: str) -> str | None:
+    """Retourne 'forte' / 'faible' pour un libellé de zone, None si inconnu."""
+    zone = zone.strip().lower()
+    for mot, densite in _MOTS_ZONE:
+        if mot in zone:
+            return densite
+    return None
+
+
+def format_fichier(chemin: str) -> str:
+    ext = os.path.splitext(chemin)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Format non reconnu pour {chemin!r} (attendu : .csv ou .jsonl)")
+
+
+# ─────────────────────────────────────────────
+# LECTURE PAR LOTS
+# ─────────────────────────────────────────────
+def lire_lots(chemin: str, taille_lot: int = TAILLE_LOT):
+    """Itère sur les lots bruts du fichier : lignes CSV découpées ou lignes JSON.
+
+    Le BOM éventuel (CSV enregistré par Excel) est ignoré ; l'en-tête CSV est
+    vérifié dès le premier lot demandé.
+    """
+    fmt = format_fichier(chemin)
+    with open(chemin, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            lecteur = csv.reader(f)
+            entetes = [c.strip().lower() for c in next(lecteur, [])]
+            positions = [entetes.index(c) if c in entetes else None for c in ("nom", "age", "zone")]
+            if positions[1] is None or positions[2] is None:
+                raise ValueError("Le CSV doit contenir au moins les colonnes 'age' et 'zone'")
+            while lot := list(islice(lecteur, taille_lot)):
+                yield fmt, positions, lot
+        else:
+            lignes = (l for l in f if l.strip())
+            while lot := list(islice(lignes, taille_lot)):
+                yield fmt, None, lot
+
+
+def _extraire(fmt: str, positions, lot: list) -> tuple[list, list, list]:
+    noms, ages, zones = [], [], []
+    if fmt == "csv":
+        i_nom, i_age, i_zone = positions
+        for ligne in lot:
+            noms.append(ligne[i_nom] if i_nom is not None and i_nom < len(ligne) else "")
+            ages.append(ligne[i_age] if i_age < len(ligne) else "")
+            zones.append(ligne[i_zone] if i_zone < len(ligne) else "")
+    else:
+        for ligne in lot:
+            try:
+                p = json.loads(ligne)
+            except json.JSONDecodeError:
+                p = {}
+            if not isinstance(p, dict):    # JSON valide mais pas un objet : ligne invalide
+                p = {}
+            noms.append(str(p.get("nom", "")))
+            ages.append(p.get("age", ""))
+            zones.append(str(p.get("zone", "")))
+    return noms, ages, zones
+
+
+def _age_entier(valeur) -> int | None:
+    if isinstance(valeur, str):
+        # « 80.0 » (CSV exporté d'un tableur) vaut 80, comme 80.0 en JSONL
+        try:
+            valeur = float(valeur)
+        except ValueError:
+            return None
+    if isinstance(valeur, float):
+        return int(valeur) if valeur.is_integer() else None
+    try:
+        return int(valeur)
+    except (TypeError, ValueError):
+        return None
+
+
+# ─────────────────────────────────────────────
+# TARIFICATION D'UN LOT
+# ─────────────────────────────────────────────
+def traiter_lot(fmt: str, positions, lot: list, format_sortie: str) -> str:
+    """Tarifie un lot brut et retourne le texte sérialisé à écrire en sortie."""
+    noms, ages_bruts, zones = _extraire(fmt, positions, lot)
+    n = len(noms)
+
+    ages = np.zeros(n, dtype=np.int64)
+    densites = np.zeros(n, dtype=np.uint8)
+    erreurs = [""] * n
+    cache_zones = {}
+    for i in range(n):
+        age = _age_entier(ages_bruts[i])
+        if age is None:
+            erreurs[i] = "âge invalide"
+            continue
+        if not AGE_MIN <= age <= AGE_MAX:
+            erreurs[i] = f"âge hors barème ({AGE_MIN}–{AGE_MAX})"
+            continue
+        zone = zones[i]
+        if zone not in cache_zones:
+            cache_zones[zone] = densite_depuis_zone(zone)
+        densite = cache_zones[zone]
+        if densite is None:
+            erreurs[i] = "zone inconnue"
+            continue
+        ages[i] = age
+        densites[i] = densite == "faible"
+
+    valides = np.array([not e for e in erreurs], dtype=bool)
+    pp = np.full(n, np.nan)
+    ch = np.full(n, np.nan)
+    pc = np.full(n, np.nan)
+    if valides.any():
+        pp[valides], ch[valides], pc[valides] = calcul_primes_vectorise(
+            ages[valides], densites[valides]
+        )
+
+    sortie = io.StringIO()
+    if format_sortie == "csv":
+        ecrivain = csv.writer(sortie, lineterminator="\n")
+        for i in range(n):
+            if erreurs[i]:
+                ecrivain.writerow([noms[i], ages_bruts[i], zones[i], "", "", "", "", erreurs[i]])
+            else:
+                ecrivain.writerow([
+                    noms[i], int(ages[i]), zones[i], "faible" if densites[i] else "forte",
+                    f"{pp[i]:.2f}", f"{ch[i]:.2f}", f"{pc[i]:.2f}", "",
+                ])
+    else:
+        for i in range(n):
+            if erreurs[i]:
+                devis = {"nom": noms[i], "age": ages_bruts[i], "zone": zones[i], "erreur": erreurs[i]}
+            else:
+                devis = {
+                    "nom": noms[i], "age": int(ages[i]), "zone": zones[i],
+                    "densite": "faible" if densites[i] else "forte",
+                    "prime_pure": round(float(pp[i]), 2),
+                    "chargements": round(float(ch[i]), 2),
+                    "prime_commerciale": round(float(pc[i]), 2),
+                }
+            sortie.write(json.dumps(devis, ensure_ascii=False))
+            sortie.write("\n")
+    return sortie.getvalue()
+
+
+# ─────────────────────────────────────────────
+# PILOTAGE
+# ─────────────────────────────────────────────
+def tarifer_fichier(
+    entree: str,
+    sortie: str,
+    taille_lot: int = TAILLE_LOT,
+    processus: int | None = None,
+    seuil_parallele: float = SEUIL_PARALLELE,
+) -> int:
+    """Tarifie `entree` vers `sortie` et retourne le nombre de prospects traités."""
+    format_sortie = format_fichier(sortie)
+    processus = processus or os.cpu_count() or 1
+    parallele = processus > 1 and os.path.getsize(entree) > seuil_parallele * 1024 * 1024
+    total = 0
+
+    # Premier lot lu avant d'ouvrir la sortie : une entrée illisible ou un
+    # en-tête invalide ne laisse pas de fichier de devis tronqué
+    lots = lire_lots(entree, taille_lot)
+    premier = next(lots, None)
+    if premier is not None:
+        lots = chain([premier], lots)
+
+    with open(sortie, "w", newline="", encoding="utf-8") as f:
+        if format_sortie == "csv":
+            f.write(",".join(COLONNES_SORTIE) + "\n")
+
+        if not parallele:
+            for fmt, positions, lot in lots:
+                f.write(traiter_lot(fmt, positions, lot, format_sortie))
+                total += len(lot)
+            return total
+
+        # Nombre de lots en vol borné : la mémoire ne dépend pas de la taille du fichier
+        en_vol = deque()
+        with ProcessPoolExecutor(max_workers=processus) as pool:
+            for fmt, positions, lot in lots:
+                if len(en_vol) >= 2 * processus:
+                    f.write(en_vol.popleft().result())
+                en_vol.append(pool.submit(traiter_lot, fmt, positions, lot, format_sortie))
+                total += len(lot)
+            while en_vol:
+                f.write(en_vol.popleft().result())
+    return total
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Tarification en masse de prospects Umbrella Santé Senior."
+    )
+    parser.add_argument("entree", help="fichier de prospects (.csv ou .jsonl)")
+    parser.add_argument("sortie", help="fichier de devis à écrire (.csv ou .jsonl)")
+    parser.add_argument("--taille-lot", type=int, default=TAILLE_LOT,
+                        help=f"prospects par lot (défaut : {TAILLE_LOT})")
+    parser.add_argument("--processus", type=int, default=None,
+                        help="taille du pool de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--seuil-parallele", type=float, default=SEUIL_PARALLELE,
+                        help=f"taille d'entrée (Mo) au-delà de laquelle le pool est utilisé "
+                             f"(défaut : {SEUIL_PARALLELE})")
+    args = parser.parse_args(argv)
+
+    try:
+        total = tarifer_fichier(
+            args.entree, args.sortie,
+            taille_lot=args.taille_lot,
+            processus=args.processus,
+            seuil_parallele=args.seuil_parallele,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    print(f"{total} prospects tarifés → {args.sortie}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
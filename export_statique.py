@@ -0,0 +1,184 @@
+"""Export de la page d'accueil en HTML statique.
+
+Usage :
+    python export_statique.py --url-calculateur https://devis.umbrella.example/
+    python export_statique.py --sortie dist
+
+Produit dist/index.html et dist/assets/ : navbar, bandeau, hero, solutions,
+étapes, témoignages, FAQ et pied de page rendus une fois en HTML (mêmes
+fragments que app.py, voir sections.py), feuille de style minifiée, polices et
+variantes WebP / JPEG du logo (celles d'images.py, même <picture> que la page)
+publiées sous un nom empreinté. Seul le calculateur reste dynamique :
+une iframe vers l'application Streamlit en ?vue=calculateur, chargée
+quand le visiteur s'en approche. Le premier affichage ne demande donc
+aucune exécution Python.
+
+Cache conseillé côté serveur web : assets/* « public, max-age=31536000,
+immutable » (le nom change avec le contenu) ; index.html « no-cache ».
+"""
+import argparse
+import hashlib
+import html
+import os
+import re
+import sys
+from dataclasses import replace
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from contenu import ErreurContenu
+from images import LARGEURS_LOGO, Variante, html_picture, variantes_image
+from polices import faces_construites, liens_prechargement, regles_polices
+from ressources import RACINE, css_minifie, trouver_ressource
+from sections import (
+    BANDEAU_ACADEMIQUE, LOGO_TEXTE, PIED_DE_PAGE,
+    barre_navigation, bloc_html, entete, faq_html, hero_html,
+)
+
+DOSSIER_SORTIE      = os.path.join(RACINE, "dist")
+URL_CALCULATEUR     = "http://localhost:8501/"
+HAUTEUR_CALCULATEUR = 760    # px : formulaire + carte de résultat
+
+# Noms écrits par Publication : <base>.<12 hex>.<ext>
+_RE_EMPREINTE = re.compile(r"[^.]+\.[0-9a-f]{12}\.[a-z0-9]+")
+
+
+class Publication:
+    """Fichiers empreintés écrits dans <sortie>/assets/ pendant un export."""
+
+    def __init__(self, sortie: str):
+        self.dossier = os.path.join(sortie, "assets")
+        self.ecrits = set()
+
+    def publier(self, contenu: bytes, nom: str) -> str:
+        base, ext = os.path.splitext(nom.lower())
+        nom_publie = f"{base}.{hashlib.sha256(contenu).hexdigest()[:12]}{ext}"
+        cible = os.path.join(self.dossier, nom_publie)
+        if not os.path.exists(cible):
+            os.makedirs(self.dossier, exist_ok=True)
+            _ecrire(cible, contenu)
+        self.ecrits.add(nom_publie)
+        return f"assets/{nom_publie}"
+
+    def copier(self, chemin: str) -> str:
+        """Copie un fichier déjà empreinté (static/cache/) sous le même nom."""
+        nom = os.path.basename(chemin)
+        cible = os.path.join(self.dossier, nom)
+        if not os.path.exists(cible):
+            os.makedirs(self.dossier, exist_ok=True)
+            with open(chemin, "rb") as f:
+                _ecrire(cible, f.read())
+        self.ecrits.add(nom)
+        return f"assets/{nom}"
+
+    def publier_variantes(self, variantes: tuple[Variante, ...]) -> tuple[Variante, ...]:
+        """Variantes WebP / JPEG de images.py copiées dans assets/, URLs relatives à la page."""
+        return tuple(replace(v, url=self.copier(v.fichier)) for v in variantes)
+
+    def purger(self):
+        """Supprime les versions précédentes, plus référencées par index.html.
+
+        Seuls les fichiers au nom empreinté (écrits par cet outil) sont
+        concernés : un dossier assets/ existant (celui du dépôt, si
+        --sortie vise la racine) garde ses autres fichiers et sous-dossiers.
+        """
+        for f in os.listdir(self.dossier):
+            chemin = os.path.join(self.dossier, f)
+            if f not in self.ecrits and _RE_EMPREINTE.fullmatch(f) and os.path.isfile(chemin):
+                os.remove(chemin)
+
+
+def _ecrire(cible: str, contenu: bytes):
+    tmp = f"{cible}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(contenu)
+    os.replace(tmp, cible)
+
+
+def url_vue_calculateur(url_app: str) -> str:
+    """URL de l'application en mode calculateur seul, sans habillage Streamlit."""
+    parties = urlsplit(url_app)
+    requete = dict(parse_qsl(parties.query))
+    requete.update({"vue": "calculateur", "embed": "true"})
+    return urlunsplit(parties._replace(query=urlencode(requete)))
+
+
+def construire_page(publication: Publication, url_calculateur: str, hauteur: int) -> str:
+    # Polices auto-hébergées : @font-face en tête de la feuille (même dossier),
+    # @import Google Fonts tant qu'elles ne sont pas construites
+    polices = []
+    for entree, chemin in faces_construites():
+        with open(chemin, "rb") as f:
+            polices.append((entree, publication.publier(f.read(), entree["fichier"])))
+    relatives = [(e, os.path.basename(url)) for e, url in polices]
+    url_css = publication.publier((regles_polices(relatives) + css_minifie()).encode(), "style.css")
+    logo_path = trouver_ressource("logo.jpg")
+    logo_html = LOGO_TEXTE
+    if logo_path:
+        # Mêmes variantes et même <picture> que la page Streamlit : 52 px, 1x / 2x / 3x
+        variantes = publication.publier_variantes(variantes_image(logo_path, LARGEURS_LOGO))
+        logo_html = html_picture(variantes, "Umbrella", sizes="52px", chargement="eager")
+
+    iframe = (
+        f'<iframe class="calculateur-integre" src="{html.escape(url_vue_calculateur(url_calculateur))}" '
+        f'title="Calculateur de prime" height="{hauteur}" loading="lazy"></iframe>'
+    )
+    corps = "".join([
+        barre_navigation(logo_html),
+        BANDEAU_ACADEMIQUE,
+        hero_html(),
+        bloc_html("solutions"),
+        bloc_html("howto"),
+        '<div id="devis"></div>',
+        entete("devis", iframe),
+        bloc_html("temoignages"),
+        '<div id="faq"></div>',
+        entete("faq", f'<div class="faq-liste">{faq_html()}</div>'),
+        PIED_DE_PAGE,
+    ])
+    return f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Umbrella Assurance</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🛡️</text></svg>">
+{liens_prechargement(polices)}
+<link rel="stylesheet" href="{url_css}">
+</head>
+<body class="page-statique">
+{corps}
+</body>
+</html>
+"""
+
+
+def exporter(sortie: str = DOSSIER_SORTIE, url_calculateur: str = URL_CALCULATEUR,
+             hauteur: int = HAUTEUR_CALCULATEUR) -> str:
+    """Écrit <sortie>/index.html et ses ressources ; retourne le chemin de la page."""
+    publication = Publication(sortie)
+    page = construire_page(publication, url_calculateur, hauteur)
+    chemin = os.path.join(sortie, "index.html")
+    _ecrire(chemin, page.encode("utf-8"))
+    publication.purger()
+    return chemin
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export statique de la page d'accueil Umbrella.")
+    parser.add_argument("--sortie", default=DOSSIER_SORTIE, help=f"dossier de sortie (défaut : {DOSSIER_SORTIE})")
+    parser.add_argument("--url-calculateur", default=URL_CALCULATEUR,
+                        help=f"URL publique de l'application Streamlit (défaut : {URL_CALCULATEUR})")
+    parser.add_argument("--hauteur-calculateur", type=int, default=HAUTEUR_CALCULATEUR,
+                        help=f"hauteur de l'iframe en px (défaut : {HAUTEUR_CALCULATEUR})")
+    args = parser.parse_args(argv)
+    try:
+        chemin = exporter(args.sortie, args.url_calculateur, args.hauteur_calculateur)
+    except (OSError, ErreurContenu) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    print(f"Page statique écrite : {chemin}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
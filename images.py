@@ -0,0 +1,151 @@
+"""Variantes d'images redimensionnées (JPEG + WebP) pour la page.
+
+Chaque image source est déclinée en largeurs fixes, réencodées et publiées
+dans static/cache/ sous un nom dérivé du hash de la source : la génération
+a lieu une fois (au premier besoin), puis le fichier sur disque est réutilisé
+par tous les processus et toutes les sessions. Le navigateur choisit la plus
+petite variante suffisante via srcset / sizes.
+"""
+import hashlib
+import html
+import io
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image, ImageOps, features
+
+from ressources import DOSSIER_PUBLIE, empreinte_fichier, hash_fichier, publier, service_statique_actif
+
+LARGEURS        = (480, 960, 1440)
+LARGEURS_LOGO   = (52, 104, 156)     # logo affiché en 52 px : 1x / 2x / 3x
+QUALITE_JPEG    = 82
+QUALITE_WEBP    = 80
+WEBP_DISPONIBLE = features.check("webp")
+
+_verrou = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Variante:
+    largeur: int
+    hauteur: int
+    format: str      # "jpeg" ou "webp"
+    url: str
+    fichier: str     # fichier publié dans static/cache/
+
+
+def _encoder(image: Image.Image, fmt: str) -> bytes:
+    tampon = io.BytesIO()
+    if fmt == "webp":
+        image.save(tampon, "WEBP", quality=QUALITE_WEBP, method=6)
+    else:
+        image.convert("RGB").save(
+            tampon, "JPEG", quality=QUALITE_JPEG, optimize=True, progressive=True
+        )
+    return tampon.getvalue()
+
+
+def _dimensions(chemin: str) -> tuple[int, int, bool]:
+    """(largeur, hauteur, est_jpeg) affichés (orientation EXIF comprise), sans décoder l'image."""
+    with Image.open(chemin) as image:
+        largeur, hauteur = image.size
+        if image.getexif().get(0x0112) in (5, 6, 7, 8):
+            largeur, hauteur = hauteur, largeur
+        return largeur, hauteur, image.format == "JPEG"
+
+
+@lru_cache(maxsize=16)
+def _variantes(chemin: str, mtime_ns: int, largeurs: tuple[int, ...]) -> tuple[Variante, ...]:
+    with _verrou:
+        hash_source = hash_fichier(chemin)
+        base = os.path.splitext(os.path.basename(chemin))[0].lower()
+        formats = ("webp", "jpeg") if WEBP_DISPONIBLE else ("jpeg",)
+        largeur_source, hauteur_source, source_jpeg = _dimensions(chemin)
+        # Pas d'agrandissement : les largeurs au-delà de la source sont ramenées à celle-ci
+        cibles = sorted({min(l, largeur_source) for l in largeurs})
+
+        # Source décodée seulement si une variante manque sur disque
+        source = None
+        def redimensionner(largeur, hauteur):
+            nonlocal source
+            if source is None:
+                with Image.open(chemin) as ouverte:
+                    source = ImageOps.exif_transpose(ouverte)
+                    source.load()
+            return source.resize((largeur, hauteur), Image.LANCZOS)
+
+        variantes = []
+        for largeur in cibles:
+            hauteur = round(hauteur_source * largeur / largeur_source)
+            image = None
+            for fmt in formats:
+                ext = ".webp" if fmt == "webp" else ".jpg"
+                parametres = f"{hash_source}:{largeur}:{fmt}:{QUALITE_JPEG}:{QUALITE_WEBP}"
+                empreinte = hashlib.sha256(parametres.encode()).hexdigest()
+
+                def ecrire(tmp, fmt=fmt):
+                    nonlocal image
+                    if image is None:
+                        image = redimensionner(largeur, hauteur)
+                    contenu = _encoder(image, fmt)
+                    # À pleine largeur, on garde la source JPEG si le réencodage la grossit
+                    if largeur == largeur_source and fmt == "jpeg" and source_jpeg \
+                            and len(contenu) > os.path.getsize(chemin):
+                        with open(chemin, "rb") as f:
+                            contenu = f.read()
+                    with open(tmp, "wb") as f:
+                        f.write(contenu)
+
+                url = publier(f"{base}-{largeur}w{ext}", empreinte, ecrire)
+                fichier = os.path.join(DOSSIER_PUBLIE, os.path.basename(url))
+                variantes.append(Variante(largeur, hauteur, fmt, url, fichier))
+        return tuple(variantes)
+
+
+def variantes_image(chemin: str, largeurs: tuple[int, ...] = LARGEURS) -> tuple[Variante, ...]:
+    """Variantes publiées de l'image, générées une seule fois par source (hash + mtime)."""
+    return _variantes(*empreinte_fichier(chemin), tuple(largeurs))
+
+
+def balise_picture(
+    chemin: str,
+    alt: str,
+    sizes: str,
+    largeurs: tuple[int, ...] = LARGEURS,
+    style: str = "",
+    chargement: str = "lazy",
+) -> str | None:
+    """<picture> avec srcset WebP / JPEG, ou None si le service statique est inactif
+    ou les variantes ne peuvent pas être publiées."""
+    if not service_statique_actif():
+        return None
+    try:
+        variantes = variantes_image(chemin, largeurs)
+    except OSError:
+        return None   # static/cache/ non inscriptible : repli de l'appelant
+    return html_picture(variantes, alt, sizes, style, chargement)
+
+
+def html_picture(
+    variantes: tuple[Variante, ...],
+    alt: str,
+    sizes: str,
+    style: str = "",
+    chargement: str = "lazy",
+) -> str:
+    """Balisage <picture> de variantes publiées (URLs telles quelles)."""
+    jpeg = [v for v in variantes if v.format == "jpeg"]
+    webp = [v for v in variantes if v.format == "webp"]
+    srcset = lambda vs: ", ".join(f"{v.url} {v.largeur}w" for v in vs)
+    source_webp = (
+        f'<source type="image/webp" srcset="{srcset(webp)}" sizes="{sizes}">' if webp else ""
+    )
+    attr_style = f' style="{style}"' if style else ""
+    return (
+        f"<picture>{source_webp}"
+        f'<img src="{jpeg[0].url}" srcset="{srcset(jpeg)}" sizes="{sizes}" '
+        f'alt="{html.escape(alt)}" loading="{chargement}" decoding="async"{attr_style}>'
+        f"</picture>"
+    )
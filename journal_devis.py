@@ -0,0 +1,214 @@
+"""Journal des devis calculés (une ligne JSON par soumission du calculateur).
+
+Le rerun ne fait que déposer l'événement dans une file bornée en mémoire
+(put_nowait, jamais bloquant) ; un thread d'arrière-plan la vide par lots,
+écrit chaque lot en un seul write(), applique la politique de fsync et fait
+tourner le fichier quand il dépasse la taille maximale. Le fichier actif
+s'appelle devis.jsonl ; chaque segment clos est renommé
+devis.<horodatage UTC>.jsonl dans le même dossier (voir compaction_devis.py).
+
+Configuration par variables d'environnement :
+    UMBRELLA_JOURNAL_DEVIS        chemin du fichier actif (défaut : journal/devis.jsonl)
+    UMBRELLA_JOURNAL_FSYNC        aucun | lot | intervalle (défaut : intervalle)
+    UMBRELLA_JOURNAL_TAILLE_MAX   taille de rotation en octets (défaut : 64 Mio)
+
+Si la file est pleine (disque saturé, rafale extrême), l'événement est
+compté dans `perdus` et abandonné plutôt que de ralentir la page.
+Un seul écrivain par fichier : plusieurs processus doivent avoir chacun leur
+chemin.
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from ressources import RACINE
+
+CHEMIN_JOURNAL      = os.path.join(RACINE, "journal", "devis.jsonl")
+TAILLE_FILE         = 10_000            # événements en attente au maximum
+TAILLE_LOT          = 1_000             # événements par write()
+DELAI_LOT           = 0.25              # secondes d'attente pour compléter un lot
+TAILLE_MAX          = 64 * 1024 * 1024  # octets avant rotation
+INTERVALLE_FSYNC    = 1.0               # secondes, politique « intervalle »
+POLITIQUES_FSYNC    = ("aucun", "lot", "intervalle")
+
+_FIN = object()
+
+
+class JournalDevis:
+    """Écrivain JSONL asynchrone : file bornée + thread d'écriture par lots."""
+
+    def __init__(
+        self,
+        chemin: str = CHEMIN_JOURNAL,
+        fsync: str = "intervalle",
+        taille_max: int = TAILLE_MAX,
+        taille_file: int = TAILLE_FILE,
+        intervalle_fsync: float = INTERVALLE_FSYNC,
+    ):
+        if fsync not in POLITIQUES_FSYNC:
+            raise ValueError(f"Politique de fsync inconnue : {fsync!r} (attendu : {', '.join(POLITIQUES_FSYNC)})")
+        self.chemin = os.path.abspath(chemin)
+        self.fsync = fsync
+        self.taille_max = taille_max
+        self.intervalle_fsync = intervalle_fsync
+        self.ecrits = 0
+        self.perdus = 0
+        self._file = queue.Queue(maxsize=taille_file)
+        self._fichier = None
+        self._dernier_fsync = time.monotonic()
+        self._a_synchroniser = False    # écrit depuis le dernier fsync
+        self._ferme = False
+        self._thread = threading.Thread(target=self._boucle, name="journal-devis", daemon=True)
+        self._thread.start()
+
+    # ── côté rerun ───────────────────────────
+    def enregistrer(self, evenement: dict) -> bool:
+        """Dépose l'événement sans attendre ; False s'il a été abandonné (file pleine)."""
+        if self._ferme:
+            return False
+        try:
+            self._file.put_nowait(evenement)
+            return True
+        except queue.Full:
+            self.perdus += 1
+            return False
+
+    def fermer(self, delai: float = 5.0):
+        """Écrit les événements en attente, synchronise et ferme le fichier."""
+        if self._ferme:
+            return
+        self._ferme = True
+        # put bloquant : la file peut être pleine au moment de l'arrêt ;
+        # borné, pour ne jamais bloquer la sortie de l'interpréteur
+        try:
+            self._file.put(_FIN, timeout=delai)
+        except queue.Full:
+            return
+        self._thread.join(delai)
+
+    # ── côté thread d'écriture ───────────────
+    def _boucle(self):
+        # Politique « intervalle » : l'attente est bornée pour qu'un dernier
+        # lot soit synchronisé même si aucun autre devis ne suit
+        attente = self.intervalle_fsync if self.fsync == "intervalle" else None
+        fin = False
+        while not fin:
+            try:
+                lot = [self._file.get(timeout=attente)]
+            except queue.Empty:
+                self._synchroniser_inactif()
+                continue
+            limite = time.monotonic() + DELAI_LOT
+            while len(lot) < TAILLE_LOT and lot[-1] is not _FIN:
+                try:
+                    lot.append(self._file.get(timeout=max(0.0, limite - time.monotonic())))
+                except queue.Empty:
+                    break
+            if lot[-1] is _FIN:
+                lot.pop()
+                fin = True
+            try:
+                if lot:
+                    self._ecrire(lot)
+                if fin:
+                    self._clore_fichier(synchroniser=self.fsync != "aucun")
+            except Exception:
+                # Disque indisponible, valeur non sérialisable… : le lot est
+                # perdu mais le thread continue de vider la file
+                self.perdus += len(lot)
+                try:
+                    self._clore_fichier(synchroniser=False)
+                except Exception:
+                    self._fichier = None
+
+    def _synchroniser_inactif(self):
+        """File vide depuis un intervalle : fsync des écritures encore en attente."""
+        if self._fichier is None or not self._a_synchroniser:
+            return
+        try:
+            os.fsync(self._fichier.fileno())
+        except OSError:
+            return     # nouvelle tentative au prochain intervalle
+        self._dernier_fsync = time.monotonic()
+        self._a_synchroniser = False
+
+    def _ecrire(self, lot: list[dict]):
+        donnees = "".join(
+            json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in lot
+        ).encode("utf-8")
+        f = self._ouvrir()
+        if f.tell() and f.tell() + len(donnees) > self.taille_max:
+            self._tourner()
+            f = self._ouvrir()
+        f.write(donnees)
+        f.flush()
+        self.ecrits += len(lot)
+        self._a_synchroniser = True
+        maintenant = time.monotonic()
+        if self.fsync == "lot" or (
+            self.fsync == "intervalle" and maintenant - self._dernier_fsync >= self.intervalle_fsync
+        ):
+            os.fsync(f.fileno())
+            self._dernier_fsync = maintenant
+            self._a_synchroniser = False
+
+    def _ouvrir(self):
+        if self._fichier is None:
+            os.makedirs(os.path.dirname(self.chemin), exist_ok=True)
+            self._fichier = open(self.chemin, "ab")
+        return self._fichier
+
+    def _clore_fichier(self, synchroniser: bool):
+        if self._fichier is None:
+            return
+        try:
+            self._fichier.flush()
+            if synchroniser:
+                os.fsync(self._fichier.fileno())
+                self._a_synchroniser = False
+        finally:
+            self._fichier.close()
+            self._fichier = None
+
+    def _tourner(self):
+        """Clôt le fichier actif et le renomme en segment horodaté."""
+        self._clore_fichier(synchroniser=self.fsync != "aucun")
+        base, ext = os.path.splitext(self.chemin)
+        horodatage = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S_%f")
+        os.replace(self.chemin, f"{base}.{horodatage}{ext}")
+
+
+def evenement_devis(age: int, densite: str, prime_pure: float, chargements: float,
+                    prime_commerciale: float, session: str | None) -> dict:
+    """Ligne du journal pour un devis (sans le prénom saisi)."""
+    return {
+        "horodatage": datetime.now(timezone.utc).isoformat(),
+        "session": session,
+        "age": age,
+        "densite": densite,
+        "prime_pure": prime_pure,
+        "chargements": round(chargements, 6),
+        "prime_commerciale": round(prime_commerciale, 6),
+    }
+
+
+_journal = None
+_verrou = threading.Lock()
+
+
+def journal_devis() -> JournalDevis:
+    """Écrivain partagé par toutes les sessions du processus, fermé proprement à l'arrêt."""
+    global _journal
+    with _verrou:
+        if _journal is None:
+            _journal = JournalDevis(
+                chemin=os.environ.get("UMBRELLA_JOURNAL_DEVIS", CHEMIN_JOURNAL),
+                fsync=os.environ.get("UMBRELLA_JOURNAL_FSYNC", "intervalle"),
+                taille_max=int(os.environ.get("UMBRELLA_JOURNAL_TAILLE_MAX", TAILLE_MAX)),
+            )
+            atexit.register(_journal.fermer)
+        return _journal
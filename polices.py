@@ -0,0 +1,265 @@
+"""Polices Raleway et Inter auto-hébergées, réduites aux glyphes de la page.
+
+Usage (construction, requiert fontTools + brotli : requirements-dev.txt) :
+    python polices.py --telecharger    # récupère les sources manquantes puis construit
+    python polices.py                  # construit à partir des sources déjà déposées
+
+Les fontes sources (variables, telles que publiées par Google Fonts) sont
+lues dans assets/polices/sources/ (non versionné) :
+    Raleway[wght].ttf        https://github.com/google/fonts/tree/main/ofl/raleway
+    Inter[opsz,wght].ttf     https://github.com/google/fonts/tree/main/ofl/inter
+
+La construction restreint l'axe de graisse aux graisses utilisées, fige les
+autres axes, ne garde que le jeu latin français et les caractères présents
+dans les textes de la page, puis écrit des fichiers WOFF2 dans
+assets/polices/ avec un manifeste (polices.json) qui décrit chaque face.
+Les WOFF2 et le manifeste sont versionnés : à reconstruire et committer
+quand les textes de la page gagnent des caractères hors du jeu français.
+
+À l'exécution, seuls le manifeste et les WOFF2 sont lus (pas de fontTools) :
+balise_styles() publie les fichiers sous un nom empreinté, ajoute les
+@font-face (font-display: swap) en tête de la feuille de style publiée et
+des liens <link rel="preload">. L'@import Google Fonts ne sert que de repli
+si les fichiers manquent ou sans service statique.
+"""
+import argparse
+import html
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.request import urlopen
+
+from ressources import (
+    CHEMIN_CSS, DOSSIER_ASSETS, RACINE,
+    balise_css, empreinte_fichier, publier_fichier, service_statique_actif,
+)
+
+DOSSIER_POLICES = os.path.join(DOSSIER_ASSETS, "polices")
+DOSSIER_SOURCES = os.path.join(DOSSIER_POLICES, "sources")
+MANIFESTE       = os.path.join(DOSSIER_POLICES, "polices.json")
+
+# Repli tant qu'aucune face n'est construite
+IMPORT_GOOGLE_FONTS = (
+    "@import url('https://fonts.googleapis.com/css2?family=Raleway:wght@400;600;700;800;900"
+    "&family=Inter:wght@300;400;500;600&display=swap');"
+)
+
+# Textes dont les caractères doivent être couverts (entités HTML décodées)
+FICHIERS_TEXTE = ("app.py", "calculateur.py", "sections.py", os.path.join("donnees", "contenu.json"))
+
+# Latin de base, Latin-1 (accents, « », ·, espace insécable), Œ œ Ÿ,
+# tirets, apostrophes et guillemets typographiques, …, €, espace fine, ›, →
+JEU_FRANCAIS = (
+    set(range(0x20, 0x7F)) | set(range(0xA0, 0x100))
+    | {0x152, 0x153, 0x178, 0x2013, 0x2014, 0x2018, 0x2019, 0x201A, 0x201C, 0x201D,
+       0x201E, 0x2022, 0x2026, 0x202F, 0x2039, 0x203A, 0x20AC, 0x2192}
+)
+
+
+@dataclass(frozen=True)
+class Face:
+    famille: str
+    source: str                # fichier dans assets/polices/sources/
+    sortie: str                # WOFF2 écrit dans assets/polices/
+    graisses: tuple[int, int]  # plage conservée sur l'axe wght
+    url: str                   # téléchargement de la source (--telecharger)
+    precharger: bool = True
+
+
+FACES = (
+    Face("Raleway", "Raleway[wght].ttf", "raleway.woff2", (400, 900),
+         "https://github.com/google/fonts/raw/main/ofl/raleway/Raleway%5Bwght%5D.ttf"),
+    Face("Inter", "Inter[opsz,wght].ttf", "inter.woff2", (300, 600),
+         "https://github.com/google/fonts/raw/main/ofl/inter/Inter%5Bopsz,wght%5D.ttf"),
+)
+
+
+# ─────────────────────────────────────────────
+# CONSTRUCTION (fontTools)
+# ─────────────────────────────────────────────
+def caracteres_page(racine: str = RACINE) -> set[int]:
+    """Jeu français + tout caractère des textes de la page."""
+    codes = set(JEU_FRANCAIS)
+    for nom in FICHIERS_TEXTE:
+        chemin = os.path.join(racine, nom)
+        if os.path.exists(chemin):
+            with open(chemin, encoding="utf-8") as f:
+                codes.update(ord(c) for c in html.unescape(f.read()) if c.isprintable())
+    return codes
+
+
+def plages_unicode(codes) -> str:
+    """Valeur CSS unicode-range compacte : U+20-7E, U+A0-FF, …"""
+    plages, debut, precedent = [], None, None
+    for c in sorted(codes):
+        if precedent is not None and c == precedent + 1:
+            precedent = c
+            continue
+        if debut is not None:
+            plages.append((debut, precedent))
+        debut = precedent = c
+    if debut is not None:
+        plages.append((debut, precedent))
+    return ", ".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in plages)
+
+
+def construire_face(face: Face, codes: set[int], sources: str = DOSSIER_SOURCES,
+                    destination: str = DOSSIER_POLICES) -> dict:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    police = TTFont(os.path.join(sources, face.source))
+    graisses = face.graisses
+    if "fvar" in police:
+        axes = {a.axisTag: a for a in police["fvar"].axes}
+        limites = {tag: None for tag in axes if tag != "wght"}     # figés à leur valeur par défaut
+        if "wght" in axes:
+            bas = max(graisses[0], axes["wght"].minValue)
+            haut = min(graisses[1], axes["wght"].maxValue)
+            limites["wght"] = (bas, haut) if bas < haut else bas
+            graisses = (int(bas), int(haut))
+        police = instancer.instantiateVariableFont(police, limites)
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk", "lnum", "tnum"]
+    options.name_IDs = [1, 2]
+    options.hinting = False
+    options.desubroutinize = True
+    sous_ensemble = subset.Subsetter(options)
+    sous_ensemble.populate(unicodes=codes)
+    sous_ensemble.subset(police)
+
+    os.makedirs(destination, exist_ok=True)
+    chemin = os.path.join(destination, face.sortie)
+    tmp = f"{chemin}.{os.getpid()}.tmp"
+    police.flavor = "woff2"
+    police.save(tmp)
+    os.replace(tmp, chemin)
+    return {
+        "famille": face.famille,
+        "fichier": face.sortie,
+        "graisses": list(graisses),
+        "unicode_range": plages_unicode(police.getBestCmap()),
+        "precharger": face.precharger,
+    }
+
+
+def telecharger_sources(faces=FACES, sources: str = DOSSIER_SOURCES) -> list[str]:
+    """Télécharge les fontes sources absentes ; retourne les fichiers récupérés."""
+    os.makedirs(sources, exist_ok=True)
+    recuperees = []
+    for face in faces:
+        chemin = os.path.join(sources, face.source)
+        if os.path.exists(chemin):
+            continue
+        tmp = f"{chemin}.{os.getpid()}.tmp"
+        try:
+            with urlopen(face.url, timeout=60) as reponse, open(tmp, "wb") as f:
+                while bloc := reponse.read(1 << 16):
+                    f.write(bloc)
+            os.replace(tmp, chemin)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        recuperees.append(face.source)
+    return recuperees
+
+
+def construire(faces=FACES, sources: str = DOSSIER_SOURCES, destination: str = DOSSIER_POLICES) -> list[dict]:
+    """Construit les WOFF2 de toutes les faces et écrit le manifeste."""
+    manquantes = [f.source for f in faces if not os.path.exists(os.path.join(sources, f.source))]
+    if manquantes:
+        raise FileNotFoundError(f"Fontes sources manquantes dans {sources} : {', '.join(manquantes)}")
+    codes = caracteres_page()
+    entrees = [construire_face(f, codes, sources, destination) for f in faces]
+    with open(os.path.join(destination, "polices.json"), "w", encoding="utf-8") as f:
+        json.dump(entrees, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return entrees
+
+
+# ─────────────────────────────────────────────
+# EXÉCUTION : @font-face et préchargement
+# ─────────────────────────────────────────────
+@lru_cache(maxsize=4)
+def _lire_manifeste(chemin: str, mtime_ns: int) -> tuple[tuple[dict, str], ...]:
+    dossier = os.path.dirname(chemin)
+    with open(chemin, encoding="utf-8") as f:
+        entrees = json.load(f)
+    return tuple(
+        (e, os.path.join(dossier, e["fichier"]))
+        for e in entrees if os.path.exists(os.path.join(dossier, e["fichier"]))
+    )
+
+
+def faces_construites(dossier: str = DOSSIER_POLICES) -> list[tuple[dict, str]]:
+    """(entrée du manifeste, chemin du WOFF2) des faces effectivement présentes."""
+    manifeste = os.path.join(dossier, "polices.json")
+    if not os.path.exists(manifeste):
+        return []
+    return list(_lire_manifeste(*empreinte_fichier(manifeste)))
+
+
+def css_font_face(faces: list[tuple[dict, str]]) -> str:
+    """Règles @font-face ; `faces` associe chaque entrée du manifeste à l'URL de son fichier."""
+    regles = []
+    for e, url in faces:
+        bas, haut = e["graisses"]
+        graisse = str(bas) if bas == haut else f"{bas} {haut}"
+        regles.append(
+            f"@font-face{{font-family:'{e['famille']}';font-style:normal;font-weight:{graisse};"
+            f"font-display:swap;src:url({url}) format('woff2');unicode-range:{e['unicode_range']}}}"
+        )
+    return "".join(regles)
+
+
+def regles_polices(faces: list[tuple[dict, str]]) -> str:
+    """@font-face des faces construites ; à défaut, l'@import Google Fonts."""
+    return css_font_face(faces) if faces else IMPORT_GOOGLE_FONTS
+
+
+def liens_prechargement(faces: list[tuple[dict, str]]) -> str:
+    return "".join(
+        f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>'
+        for e, url in faces if e["precharger"]
+    )
+
+
+def balise_styles(chemin: str = CHEMIN_CSS) -> str:
+    """Préchargement des polices + <link> vers la feuille de style, @font-face en tête.
+
+    Les polices ne sont servies qu'avec le service statique : en repli
+    (<style> en ligne), la feuille importe Google Fonts.
+    """
+    if not service_statique_actif():
+        return balise_css(chemin, prefixe=IMPORT_GOOGLE_FONTS)
+    publiees = [(e, url) for e, c in faces_construites() if (url := publier_fichier(c))]
+    # La feuille publiée est dans le même dossier que les polices : URL relative
+    relatives = [(e, os.path.basename(url)) for e, url in publiees]
+    return liens_prechargement(publiees) + balise_css(chemin, prefixe=regles_polices(relatives))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Construit les WOFF2 réduits et le manifeste polices.json.")
+    parser.add_argument("--telecharger", action="store_true",
+                        help="récupère d'abord les fontes sources absentes (Google Fonts, GitHub)")
+    args = parser.parse_args(argv)
+    try:
+        if args.telecharger:
+            for nom in telecharger_sources():
+                print(f"source téléchargée : {nom}")
+        for e in construire():
+            taille = os.path.getsize(os.path.join(DOSSIER_POLICES, e["fichier"]))
+            print(f"{e['fichier']:<16}{taille / 1024:>7.1f} Kio  graisses {e['graisses']}  {e['unicode_range']}")
+    except (OSError, ImportError) as erreur:
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
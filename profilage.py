@@ -0,0 +1,152 @@
+"""Profilage par section d'un rerun de app.py.
+
+Activé par la variable d'environnement UMBRELLA_PROFIL=1 ou le paramètre
+d'URL ?profil=1. Chaque section de la page est marquée par un appel à
+profil.section("nom") ; la section courante se termine au marqueur suivant.
+Pour chaque section : temps mur, temps CPU du thread du script et octets
+de messages envoyés au navigateur. Le résultat s'affiche dans un panneau
+repliable en bas de page et, si UMBRELLA_PROFIL_JSONL désigne un fichier,
+y est ajouté en une ligne JSON par rerun.
+
+Désactivé, le profileur est un objet dont les méthodes ne font rien :
+le coût se limite à un appel de méthode vide par section.
+
+Streamlit n'expose pas de point d'accroche public sur les messages émis :
+le comptage des octets relaie ScriptRunContext._enqueue (privé), vérifié
+sur les versions VERSIONS_STREAMLIT. Hors de cette plage, ou si l'attribut
+a disparu, le profilage est désactivé avec un avertissement plutôt que de
+casser la page.
+"""
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Plage [min, max[ où ScriptRunContext._enqueue a la forme attendue (1.28 à 1.65 vérifiées)
+VERSIONS_STREAMLIT = ((1, 28), (2, 0))
+
+
+class _ProfilInactif:
+    actif = False
+
+    def section(self, nom: str):
+        pass
+
+    def terminer(self):
+        pass
+
+
+class Profileur:
+    actif = True
+
+    def __init__(self):
+        self.mesures = []
+        self._octets = 0
+        self._courante = None
+        self._ctx = get_script_run_ctx()
+        self._enqueue_original = None
+        if self._ctx is not None:
+            # Compte les octets de chaque ForwardMsg émis par ce rerun
+            # (en repartant de l'original si un rerun interrompu a laissé un relais)
+            original = getattr(self._ctx._enqueue, "original", self._ctx._enqueue)
+            self._enqueue_original = original
+
+            def enqueue(msg):
+                self._octets += msg.ByteSize()
+                original(msg)
+
+            enqueue.original = original
+            object.__setattr__(self._ctx, "_enqueue", enqueue)
+        self._debut = (time.perf_counter(), time.thread_time(), 0)
+
+    def section(self, nom: str):
+        maintenant = (time.perf_counter(), time.thread_time(), self._octets)
+        self._clore(maintenant)
+        self._courante = (nom, maintenant)
+
+    def _clore(self, maintenant):
+        if self._courante is None:
+            return
+        nom, (mur, cpu, octets) = self._courante
+        self.mesures.append({
+            "section": nom,
+            "mur_ms": round((maintenant[0] - mur) * 1000, 3),
+            "cpu_ms": round((maintenant[1] - cpu) * 1000, 3),
+            "octets": maintenant[2] - octets,
+        })
+        self._courante = None
+
+    def terminer(self):
+        self._clore((time.perf_counter(), time.thread_time(), self._octets))
+        if self._enqueue_original is not None:
+            object.__setattr__(self._ctx, "_enqueue", self._enqueue_original)
+        total = {
+            "mur_ms": round((time.perf_counter() - self._debut[0]) * 1000, 3),
+            "cpu_ms": round((time.thread_time() - self._debut[1]) * 1000, 3),
+            "octets": self._octets,
+        }
+        chemin = os.environ.get("UMBRELLA_PROFIL_JSONL")
+        if chemin:
+            ligne = {
+                "horodatage": datetime.now(timezone.utc).isoformat(),
+                "session": self._ctx.session_id if self._ctx else None,
+                "sections": self.mesures,
+                "total": total,
+            }
+            with open(chemin, "a", encoding="utf-8") as f:
+                f.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+
+        with st.expander("🔧 Profil du rerun", expanded=False):
+            st.caption(
+                f"Total : {total['mur_ms']:.1f} ms mur · {total['cpu_ms']:.1f} ms CPU · "
+                f"{total['octets'] / 1024:.1f} Kio émis (hors panneau)"
+            )
+            # Tableau Markdown plutôt que st.dataframe : pas d'import de pandas /
+            # pyarrow au premier rerun, qui fausserait les mesures à froid
+            lignes = "".join(
+                f"| {m['section']} | {m['mur_ms']:.2f} | {m['cpu_ms']:.2f} | {m['octets']} |\n"
+                for m in self.mesures
+            )
+            st.markdown("| section | mur ms | CPU ms | octets |\n|---|--:|--:|--:|\n" + lignes)
+
+
+def _version_streamlit() -> tuple[int, ...]:
+    return tuple(int(n) for n in re.findall(r"\d+", st.__version__)[:2])
+
+
+def enqueue_interceptable(ctx) -> bool:
+    """Vrai si le relais de ctx._enqueue est sûr pour cette version de Streamlit."""
+    minimum, maximum = VERSIONS_STREAMLIT
+    return minimum <= _version_streamlit() < maximum and callable(getattr(ctx, "_enqueue", None))
+
+
+_avertissement_donne = False
+
+
+def profil_actif() -> bool:
+    if os.environ.get("UMBRELLA_PROFIL", "") not in ("", "0"):
+        return True
+    return st.query_params.get("profil", "0") not in ("", "0")
+
+
+def demarrer_profil():
+    """Profileur de ce rerun (objet inerte si le profilage est désactivé ou impossible)."""
+    global _avertissement_donne
+    if not profil_actif():
+        return _ProfilInactif()
+    ctx = get_script_run_ctx()
+    if ctx is not None and not enqueue_interceptable(ctx):
+        if not _avertissement_donne:
+            _avertissement_donne = True
+            print(
+                f"Profilage désactivé : Streamlit {st.__version__} hors de la plage vérifiée "
+                f"ou ScriptRunContext._enqueue absent",
+                file=sys.stderr,
+            )
+        return _ProfilInactif()
+    return Profileur()
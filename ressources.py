@@ -0,0 +1,212 @@
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+import shutil
+from functools import lru_cache
+
+# ─────────────────────────────────────────────
+# EMPLACEMENTS
+# ─────────────────────────────────────────────
+RACINE          = os.path.dirname(os.path.abspath(__file__))
+DOSSIER_ASSETS  = os.path.join(RACINE, "assets")
+# Servi par Streamlit sous app/static/ (server.enableStaticServing)
+DOSSIER_STATIC  = os.path.join(RACINE, "static")
+DOSSIER_PUBLIE  = os.path.join(DOSSIER_STATIC, "cache")
+URL_STATIC      = "app/static"
+
+
+def trouver_ressource(nom: str, dossier: str = DOSSIER_ASSETS) -> str | None:
+    """Chemin de `nom` dans `dossier`, sans tenir compte de la casse (Logo.jpg = logo.jpg)."""
+    chemin = os.path.join(dossier, nom)
+    if os.path.isfile(chemin):
+        return chemin
+    if not os.path.isdir(dossier):
+        return None
+    cible = nom.lower()
+    for f in sorted(os.listdir(dossier)):
+        if f.lower() == cible and os.path.isfile(os.path.join(dossier, f)):
+            return os.path.join(dossier, f)
+    return None
+
+
+def empreinte_fichier(chemin: str) -> tuple[str, int]:
+    """Clé de cache d'un fichier : (chemin absolu, mtime en ns)."""
+    chemin = os.path.abspath(chemin)
+    return chemin, os.stat(chemin).st_mtime_ns
+
+
+# ─────────────────────────────────────────────
+# ENCODAGE BASE64 (repli sans service statique)
+# ─────────────────────────────────────────────
+@lru_cache(maxsize=16)
+def _b64(chemin: str, mtime_ns: int) -> str:
+    with open(chemin, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def lire_b64(chemin: str) -> str:
+    """Contenu base64 du fichier, réencodé seulement si son mtime change."""
+    return _b64(*empreinte_fichier(chemin))
+
+
+# ─────────────────────────────────────────────
+# PUBLICATION STATIQUE (nom de fichier empreinté)
+# ─────────────────────────────────────────────
+def hash_fichier(chemin: str) -> str:
+    h = hashlib.sha256()
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+def publier(nom: str, empreinte: str, ecrire) -> str:
+    """Publie sous static/cache/<base>.<empreinte><ext> ; `ecrire(tmp)` produit le fichier."""
+    base, ext = os.path.splitext(nom.lower())
+    nom_publie = f"{base}.{empreinte[:12]}{ext}"
+    cible = os.path.join(DOSSIER_PUBLIE, nom_publie)
+    if not os.path.exists(cible):
+        os.makedirs(DOSSIER_PUBLIE, exist_ok=True)
+        tmp = f"{cible}.{os.getpid()}.tmp"
+        ecrire(tmp)
+        os.replace(tmp, cible)
+        _purger_versions(base, ext, garder=nom_publie)
+    return f"{URL_STATIC}/cache/{nom_publie}"
+
+
+@lru_cache(maxsize=32)
+def _publier_fichier(chemin: str, mtime_ns: int, nom: str) -> str | None:
+    try:
+        return publier(nom, hash_fichier(chemin), lambda tmp: _lier(chemin, tmp))
+    except OSError:
+        # static/cache/ en lecture seule : échec mis en cache, pas de nouveau hash à chaque rerun
+        return None
+
+
+def _lier(source: str, cible: str):
+    # Lien physique si possible : pas de copie pour les gros fichiers (vidéo)
+    try:
+        os.link(source, cible)
+    except OSError:
+        shutil.copyfile(source, cible)
+
+
+def publier_fichier(chemin: str, nom: str | None = None) -> str | None:
+    """Publie le fichier dans static/cache/ (lien physique ou copie) sous un nom
+    empreinté dérivé de `nom` (par défaut son nom de base) et retourne son URL.
+
+    Le nom change avec le contenu : l'URL peut rester en cache côté navigateur
+    (ETag / Last-Modified fournis par le serveur statique de Streamlit).
+    Retourne None si static/cache/ n'est pas inscriptible : l'appelant se
+    rabat sur l'envoi en ligne.
+    """
+    return _publier_fichier(*empreinte_fichier(chemin), nom or os.path.basename(chemin))
+
+
+def publier_octets(contenu: bytes, nom: str) -> str | None:
+    """Publie un contenu généré (CSS minifié…) sous un nom empreinté et retourne
+    son URL, ou None si static/cache/ n'est pas inscriptible."""
+    def ecrire(tmp):
+        with open(tmp, "wb") as f:
+            f.write(contenu)
+    try:
+        return publier(nom, hashlib.sha256(contenu).hexdigest(), ecrire)
+    except OSError:
+        return None
+
+
+def _purger_versions(base: str, ext: str, garder: str):
+    for f in os.listdir(DOSSIER_PUBLIE):
+        if f != garder and f.startswith(base + ".") and f.endswith(ext) and f.count(".") == 2:
+            try:
+                os.remove(os.path.join(DOSSIER_PUBLIE, f))
+            except OSError:
+                pass
+
+
+def service_statique_actif() -> bool:
+    import streamlit as st
+    return bool(st.get_option("server.enableStaticServing")) and os.path.isdir(DOSSIER_STATIC)
+
+
+def url_ressource(chemin: str) -> str:
+    """URL statique empreintée si le service statique est actif, data URI sinon."""
+    url = service_statique_actif() and publier_fichier(chemin)
+    if url:
+        return url
+    mime = mimetypes.guess_type(chemin)[0] or "application/octet-stream"
+    return f"data:{mime};base64,{lire_b64(chemin)}"
+
+
+# ─────────────────────────────────────────────
+# FEUILLE DE STYLE
+# ─────────────────────────────────────────────
+CHEMIN_CSS = os.path.join(DOSSIER_ASSETS, "style.css")
+
+# Chaînes et commentaires CSS ; les chaînes sont conservées telles quelles
+_RE_CSS_JETONS  = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_RE_CSS_ESPACES = re.compile(r"\s+")
+# Espaces superflus autour des séparateurs (pas avant « : », qui compte
+# dans les sélecteurs : « div :hover » ≠ « div:hover »)
+_RE_CSS_SEPARATEURS = re.compile(r"\s*([{};,>])\s*|:\s+")
+
+
+def minifier_css(css: str) -> str:
+    """Supprime commentaires et espaces superflus, sans toucher aux chaînes."""
+    morceaux, tampon = [], []
+    debut = 0
+    for m in _RE_CSS_JETONS.finditer(css):
+        tampon.append(css[debut:m.start()])
+        if m.group(1):
+            morceaux.append(_compacter_css("".join(tampon)))
+            morceaux.append(m.group(1))
+            tampon = []
+        debut = m.end()
+    tampon.append(css[debut:])
+    morceaux.append(_compacter_css("".join(tampon)))
+    return "".join(morceaux).replace(";}", "}").strip()
+
+
+def _compacter_css(bloc: str) -> str:
+    bloc = _RE_CSS_ESPACES.sub(" ", bloc)
+    return _RE_CSS_SEPARATEURS.sub(lambda m: m.group(1) or ":", bloc)
+
+
+@lru_cache(maxsize=4)
+def _css_minifie(chemin: str, mtime_ns: int) -> str:
+    with open(chemin, encoding="utf-8") as f:
+        return minifier_css(f.read())
+
+
+def css_minifie(chemin: str = CHEMIN_CSS) -> str:
+    """Feuille de style minifiée, recalculée seulement si le fichier change."""
+    return _css_minifie(*empreinte_fichier(chemin))
+
+
+def balise_css(chemin: str = CHEMIN_CSS, prefixe: str = "") -> str:
+    """<link> vers la feuille publiée (empreintée), ou <style> minifié en repli
+    (service statique inactif ou static/cache/ non inscriptible).
+
+    `prefixe` (règles de polices de polices.py) est placé en tête de la
+    feuille, publiée ou en ligne.
+    """
+    css = prefixe + css_minifie(chemin)
+    url = service_statique_actif() and publier_octets(css.encode(), os.path.basename(chemin))
+    if url:
+        return f'<link rel="stylesheet" href="{url}">'
+    return f"<style>{css}</style>"
+
+
+if __name__ == "__main__":
+    # Mesure : octets de style envoyés à chaque rerun, avant / après
+    with open(CHEMIN_CSS, encoding="utf-8") as f:
+        source = f.read()
+    avant = len(f"\n<style>\n{source}\n</style>\n".encode())
+    minifie = len(css_minifie().encode())
+    lien = len(f'<link rel="stylesheet" href="{URL_STATIC}/cache/style.0123456789ab.css">'.encode())
+    print(f"<style> inline d'origine : {avant:>7} o / rerun")
+    print(f"<style> minifié (repli)  : {minifie + 15:>7} o / rerun")
+    print(f"<link> vers fichier      : {lien:>7} o / rerun  (CSS {minifie} o, téléchargé une fois)")
+    print(f"Économie par rerun       : {avant - lien:>7} o")
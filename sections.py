@@ -0,0 +1,268 @@
+"""Fragments HTML des sections statiques de la page d'accueil.
+
+Utilisés par app.py (un st.markdown par fragment) et par export_statique.py
+(page HTML autonome) : les deux rendus partagent le même balisage et la
+même feuille de style.
+
+Les textes viennent de donnees/contenu.json (voir contenu.py) ; le balisage
+reste ici. Le hero et les blocs de cartes (solutions, étapes, témoignages)
+sont compilés par hero_html() / bloc_html() en une seule chaîne HTML
+compactée, mise en cache sous l'empreinte du fichier de contenu : une
+modification du fichier les reconstruit au rerun suivant.
+"""
+import html
+import re
+from functools import lru_cache
+
+from contenu import Contenu, charger_contenu
+
+LOGO_TEXTE = '<div class="navbar-logo-text">UMBRELLA<span>.</span></div>'
+
+
+def barre_navigation(logo_html: str) -> str:
+    return f"""
+<div class="navbar">
+  <div class="navbar-logo">
+    {logo_html}
+  </div>
+  <nav class="navbar-menu">
+    <a href="#solutions">Nos solutions</a>
+    <a href="#devis">Tarif</a>
+    <a href="#faq">FAQ</a>
+  </nav>
+  <div class="navbar-cta">
+    <a class="btn-client" href="#">🔒 Espace client</a>
+  </div>
+</div>
+"""
+
+
+BANDEAU_ACADEMIQUE = """
+<div style="
+    background: #1e3a8a;
+    padding: 0.6rem 1.5rem;
+    text-align: center;
+    font-family: Inter, sans-serif;
+    font-size: 0.78rem;
+    color: rgba(255,255,255,0.9);
+    letter-spacing: 0.2px;
+    border-bottom: 1px solid rgba(200,168,75,0.3);
+">
+  &#127891;&nbsp;
+  <strong style="color:#c8a84b;">Projet acad&#233;mique — M1 Assurance et Gestion des Risques</strong>
+  &nbsp;&#183;&nbsp;
+  Ce site est une simulation r&#233;alis&#233;e dans le cadre d&#39;un projet p&#233;dagogique.
+  Les tarifs affich&#233;s sont calcul&#233;s &#224; partir de donn&#233;es actuarielles r&#233;elles mais ne constituent pas une offre commerciale.
+  &nbsp;&#183;&nbsp;
+  <strong style="color:#c8a84b;">Umbrella Assurance n&#39;est pas une vraie compagnie d&#39;assurance.</strong>
+</div>
+"""
+
+PIED_DE_PAGE = """
+<div class="footer-main">
+  <div class="footer-logo-text">UMBRELLA<span>.</span></div>
+  <div class="footer-tagline">La mutuelle senior de confiance</div>
+  <div class="footer-links">
+    <a href="#">Mentions légales</a>
+    <a href="#">Politique de confidentialité</a>
+    <a href="#">Accessibilité</a>
+    <a href="#">Recrutement</a>
+    <a href="#">CGU</a>
+  </div>
+  <div class="footer-copy">© 2026 Umbrella Assurance — Tous droits réservés · Société soumise au contrôle de l'ACPR</div>
+</div>
+"""
+
+
+# ─────────────────────────────────────────────
+# EN-TÊTES DE SECTION
+# ─────────────────────────────────────────────
+def section(classe: str, titre: str, sous_titre: str, contenu: str = "") -> str:
+    """Bloc de section (fond, padding) avec son en-tête, suivi de `contenu`."""
+    return f"""
+<div class="{classe}">
+  <div class="section-header">
+    <h2>{titre}</h2>
+    <div class="gold-line"></div>
+    <p>{sous_titre}</p>
+  </div>{contenu}
+</div>
+"""
+
+
+CLASSES_SECTION = {
+    "solutions": "solutions-section",
+    "howto": "howto-section",
+    "devis": "devis-section",
+    "temoignages": "temoignages-section",
+    "faq": "faq-section",
+}
+
+
+def entete(nom: str, contenu: str = "", donnees: Contenu | None = None) -> str:
+    textes = (donnees or charger_contenu()).entetes[nom]
+    return section(CLASSES_SECTION[nom], textes["titre"], textes["sous_titre"], contenu)
+
+
+# ─────────────────────────────────────────────
+# HERO
+# ─────────────────────────────────────────────
+def element_confiance(item: dict) -> str:
+    return f"""
+<div class="trust-item">
+  <span class="trust-icon">{item['icone']}</span>
+  <div class="trust-text">
+    <strong>{item['titre']}</strong>
+    {item['texte']}
+  </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=4)
+def _hero_compile(donnees: Contenu) -> str:
+    h = donnees.hero
+    principale, secondaire = h["action_principale"], h["action_secondaire"]
+    return compacter_html(f"""
+<div class="hero">
+  <div class="hero-content">
+    <div class="hero-badge">{h['badge']}</div>
+    <h1 class="hero-title">{h['titre']}</h1>
+    <div class="hero-divider"></div>
+    <p class="hero-subtitle">{h['sous_titre']}</p>
+    <div class="hero-actions">
+      <a class="btn-hero-primary" href="{principale['lien']}">{principale['texte']}</a>
+      <a class="btn-hero-secondary" href="{secondaire['lien']}">{secondaire['texte']}</a>
+    </div>
+  </div>
+  <div class="hero-trust">{"".join(element_confiance(i) for i in h["confiance"])}</div>
+</div>
+""")
+
+
+def hero_html() -> str:
+    return _hero_compile(charger_contenu())
+
+
+# ─────────────────────────────────────────────
+# CARTES
+# ─────────────────────────────────────────────
+def carte_solution(s: dict) -> str:
+    featured_class = "solution-card featured" if s["featured"] else "solution-card"
+    badge_html = f'<div class="card-badge">{s["badge"]}</div>' if s["badge"] else ""
+    return f"""
+<div class="{featured_class}">
+  {badge_html}
+  <div class="icon">{s['icon']}</div>
+  <h3>{s['titre']}</h3>
+  <p>{s['desc']}</p>
+</div>
+"""
+
+
+def etape_howto(step: dict) -> str:
+    return f"""
+<div class="howto-step">
+  <div class="step-number">{step['num']}</div>
+  <h3>{step['titre']}</h3>
+  <p>{step['desc']}</p>
+</div>
+"""
+
+
+CONNECTEUR_HOWTO = (
+    '<div class="howto-connector" style="padding-top:1.8rem;text-align:center;">&#8594;</div>'
+)
+
+
+def carte_temoignage(t: dict) -> str:
+    stars_full = "&#9733;" * t["stars"] + "&#9734;" * (5 - t["stars"])
+    return f"""
+<div class="temoignage-card">
+  <div class="temoignage-stars">{stars_full}</div>
+  <p class="temoignage-text">{t['text']}</p>
+  <div class="temoignage-author">
+    <div class="author-avatar">{t['initiale']}</div>
+    <div>
+      <div class="author-name">{t['nom']}</div>
+      <div class="author-info">{t['info']}</div>
+    </div>
+  </div>
+</div>
+"""
+
+
+# ─────────────────────────────────────────────
+# FAQ (rendu HTML hors Streamlit)
+# ─────────────────────────────────────────────
+_RE_GRAS = re.compile(r"\*\*(.+?)\*\*")
+
+
+def markdown_simple(texte: str) -> str:
+    """Markdown des réponses de la FAQ → HTML : paragraphes, citations,
+    listes à puces et **gras** (le sous-ensemble utilisé par la FAQ)."""
+    blocs = []
+    for bloc in re.split(r"\n\s*\n", texte.strip()):
+        lignes = [_RE_GRAS.sub(r"<strong>\1</strong>", html.escape(l.strip(), quote=False))
+                  for l in bloc.splitlines()]
+        if all(l.startswith("- ") for l in lignes):
+            blocs.append("<ul>" + "".join(f"<li>{l[2:]}</li>" for l in lignes) + "</ul>")
+        elif all(l.startswith("&gt; ") for l in lignes):
+            blocs.append("<blockquote><p>" + " ".join(l[5:] for l in lignes) + "</p></blockquote>")
+        else:
+            blocs.append("<p>" + " ".join(lignes) + "</p>")
+    return "".join(blocs)
+
+
+def faq_html(faq=None) -> str:
+    """Questions en <details> repliables, équivalent statique des st.expander."""
+    faq = charger_contenu().faq if faq is None else faq
+    return "".join(
+        f'<details class="faq-item"><summary>{html.escape(q, quote=False)}</summary>'
+        f'<div class="faq-reponse">{markdown_simple(r)}</div></details>'
+        for q, r in faq
+    )
+
+
+def grille_solutions(donnees: Contenu) -> str:
+    return '<div class="solutions-grid">' + "".join(carte_solution(s) for s in donnees.solutions) + "</div>"
+
+
+def grille_howto(donnees: Contenu) -> str:
+    etapes = [etape_howto(step) for step in donnees.howto]
+    return '<div class="howto-steps">' + CONNECTEUR_HOWTO.join(etapes) + "</div>"
+
+
+def grille_temoignages(donnees: Contenu) -> str:
+    cartes = "".join(carte_temoignage(t) for t in donnees.temoignages)
+    return '<div class="temoignages-grid">' + cartes + "</div>"
+
+
+# ─────────────────────────────────────────────
+# BLOCS COMPILÉS (un élément par bloc)
+# ─────────────────────────────────────────────
+# nom de l'en-tête → (constructeur de la grille, ancre de navigation)
+BLOCS = {
+    "solutions": (grille_solutions, "solutions"),
+    "howto": (grille_howto, None),
+    "temoignages": (grille_temoignages, None),
+}
+
+
+def compacter_html(fragment: str) -> str:
+    """Retire indentation et lignes vides : le bloc reste un seul bloc HTML
+    pour le rendu Markdown de st.markdown (une ligne vide le couperait)."""
+    return "\n".join(l.strip() for l in fragment.splitlines() if l.strip())
+
+
+# Contenu hashable par son empreinte : une entrée par bloc et par version du fichier
+@lru_cache(maxsize=16)
+def _bloc_compile(nom: str, donnees: Contenu) -> str:
+    construire, ancre = BLOCS[nom]
+    prefixe = f'<div id="{ancre}"></div>' if ancre else ""
+    return compacter_html(prefixe + entete(nom, construire(donnees), donnees))
+
+
+def bloc_html(nom: str) -> str:
+    """En-tête + grille de cartes du bloc `nom`, rendus une fois par version du contenu."""
+    return _bloc_compile(nom, charger_contenu())
@@ -0,0 +1,113 @@
+"""Vue interne : sensibilité de la prime aux taux de marge et de frais.
+
+Usage :
+    streamlit run sensibilite.py
+
+Balaye une grille dense de taux (100 × 100 par défaut) sur tous les âges et
+les deux densités en un seul calcul diffusé (actuariat.grille_sensibilite),
+puis affiche une carte de chaleur (Vega-Lite) par densité. Le point blanc marque les
+taux en vigueur (TAUX_MARGE / TAUX_FRAIS). Page non liée depuis app.py.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+debut_page = time.perf_counter()
+
+from actuariat import AGE_MAX, AGE_MIN, DENSITES, TAUX_FRAIS, TAUX_MARGE, grille_sensibilite
+
+st.set_page_config(page_title="Umbrella — sensibilité tarifaire", page_icon="📊", layout="wide")
+st.title("Sensibilité de la prime aux taux de marge et de frais")
+
+# ─────────────────────────────────────────────
+# PARAMÈTRES
+# ─────────────────────────────────────────────
+col1, col2, col3 = st.columns(3)
+with col1:
+    marges = st.slider("Taux de marge (%)", 0.0, 60.0, (0.0, 40.0), step=0.5)
+    points = st.select_slider("Points par axe", options=[25, 50, 100, 150, 200], value=100)
+with col2:
+    frais = st.slider("Taux de frais (%)", 0.0, 50.0, (5.0, 30.0), step=0.5)
+    mesure = st.radio("Mesure", ["Prime commerciale", "Chargements"], horizontal=True)
+with col3:
+    age = st.select_slider(
+        "Âge", options=["moyenne", *range(AGE_MIN, AGE_MAX + 1)], value=80,
+        help="« moyenne » : moyenne non pondérée des primes de tous les âges du barème",
+    )
+
+# ─────────────────────────────────────────────
+# CALCUL
+# ─────────────────────────────────────────────
+debut = time.perf_counter()
+axe_marge = np.linspace(marges[0], marges[1], points) / 100
+axe_frais = np.linspace(frais[0], frais[1], points) / 100
+primes_com, chargements = grille_sensibilite(axe_marge, axe_frais)
+valeurs = primes_com if mesure == "Prime commerciale" else chargements
+# (frais, marge, âge, densité) → (frais, marge, densité)
+valeurs = valeurs.mean(axis=2) if age == "moyenne" else valeurs[:, :, age - AGE_MIN, :]
+duree_calcul = (time.perf_counter() - debut) * 1000
+
+grille_frais, grille_marge = np.meshgrid(axe_frais * 100, axe_marge * 100, indexing="ij")
+pas_marge = (marges[1] - marges[0]) / max(points - 1, 1)
+pas_frais = (frais[1] - frais[0]) / max(points - 1, 1)
+domaine = [float(valeurs.min()), float(valeurs.max())]
+
+
+# ─────────────────────────────────────────────
+# CARTES DE CHALEUR
+# Spécification Vega-Lite écrite directement : passer par Altair revaliderait
+# le schéma complet à chaque rerun (~40 ms par graphique)
+# ─────────────────────────────────────────────
+def carte_chaleur(marge_actuelle: float, frais_actuels: float) -> dict:
+    calques = [{
+        "mark": "rect",
+        "encoding": {
+            "x": {"field": "marge", "type": "quantitative", "title": "Taux de marge (%)"},
+            "x2": {"field": "marge_fin"},
+            "y": {"field": "frais", "type": "quantitative", "title": "Taux de frais (%)"},
+            "y2": {"field": "frais_fin"},
+            "color": {
+                "field": "valeur", "type": "quantitative", "title": "€ / an",
+                "scale": {"scheme": "viridis", "domain": domaine},
+            },
+            "tooltip": [
+                {"field": "marge", "type": "quantitative", "format": ".1f"},
+                {"field": "frais", "type": "quantitative", "format": ".1f"},
+                {"field": "valeur", "type": "quantitative", "format": ".2f", "title": "€ / an"},
+            ],
+        },
+    }]
+    if marges[0] <= marge_actuelle <= marges[1] and frais[0] <= frais_actuels <= frais[1]:
+        calques.append({
+            "data": {"values": [{"marge": marge_actuelle, "frais": frais_actuels}]},
+            "mark": {"type": "point", "color": "white", "size": 120, "filled": True},
+            "encoding": {
+                "x": {"field": "marge", "type": "quantitative"},
+                "y": {"field": "frais", "type": "quantitative"},
+            },
+        })
+    return {"height": 420, "layer": calques}
+
+
+colonnes = st.columns(len(DENSITES))
+for j, densite in enumerate(DENSITES):
+    donnees = pd.DataFrame({
+        "marge": grille_marge.ravel(),
+        "marge_fin": grille_marge.ravel() + pas_marge,
+        "frais": grille_frais.ravel(),
+        "frais_fin": grille_frais.ravel() + pas_frais,
+        "valeur": valeurs[:, :, j].ravel(),
+    })
+    with colonnes[j]:
+        st.subheader(f"Densité {densite}")
+        st.vega_lite_chart(
+            donnees, carte_chaleur(TAUX_MARGE[densite] * 100, TAUX_FRAIS * 100),
+            use_container_width=True,
+        )
+
+st.caption(
+    f"{points} × {points} couples de taux × {AGE_MAX - AGE_MIN + 1} âges × {len(DENSITES)} densités "
+    f"calculés en {duree_calcul:.1f} ms · page générée en {(time.perf_counter() - debut_page) * 1000:.0f} ms"
+)
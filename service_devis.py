@@ -0,0 +1,255 @@
+"""Service HTTP de devis, sans Streamlit (asyncio, HTTP/1.1 keep-alive).
+
+Usage :
+    python service_devis.py --port 8502
+
+Routes :
+    GET  /sante                          → {"statut": "ok"}
+    GET  /devis?age=80&densite=forte     → un devis
+    POST /devis        {"age": 80, "densite": "forte"}
+    POST /devis/lot    {"prospects": [{"age": 80, "densite": "forte"}, ...]}
+
+La densité peut aussi être donnée par un libellé de zone (`zone`).
+Les requêtes d'une même connexion sont traitées dans l'ordre d'arrivée :
+un client peut en envoyer plusieurs sans attendre les réponses (pipelining).
+"""
+import argparse
+import asyncio
+import json
+import sys
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from actuariat import AGE_MAX, AGE_MIN, DENSITES, calcul_primes_vectorise, construire_grille
+from devis_masse import densite_depuis_zone
+
+TAILLE_MAX_ENTETES = 16 * 1024
+TAILLE_MAX_CORPS   = 8 * 1024 * 1024
+DELAI_INACTIVITE   = 30     # secondes
+LOT_MAX            = 100_000
+
+_RAISONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+}
+
+
+class ErreurRequete(Exception):
+    def __init__(self, statut: int, message: str):
+        super().__init__(message)
+        self.statut = statut
+
+
+# ─────────────────────────────────────────────
+# MOTEUR DE DEVIS
+# ─────────────────────────────────────────────
+_GRILLE = construire_grille()
+
+
+def _devis_json(age: int, densite: str) -> bytes:
+    prime_pure, chargements, prime_com = _GRILLE.devis(age, densite)
+    return json.dumps({
+        "age": age,
+        "densite": densite,
+        "prime_pure": round(prime_pure, 2),
+        "chargements": round(chargements, 2),
+        "prime_commerciale": round(prime_com, 2),
+    }).encode()
+
+
+# Corps JSON des devis unitaires, sérialisés une fois pour toutes
+_DEVIS_SERIALISES = {
+    (age, densite): _devis_json(age, densite)
+    for age in range(AGE_MIN, AGE_MAX + 1)
+    for densite in DENSITES
+}
+
+
+def _lire_prospect(p) -> tuple[int, str]:
+    if not isinstance(p, dict):
+        raise ErreurRequete(400, "Chaque prospect doit être un objet JSON")
+    age = p.get("age")
+    # isdecimal et non isdigit : « ² » est un chiffre mais int() le refuse
+    if isinstance(age, str) and age.strip().isdecimal():
+        age = int(age)
+    if isinstance(age, float) and age.is_integer():
+        age = int(age)
+    if not isinstance(age, int) or isinstance(age, bool) or not AGE_MIN <= age <= AGE_MAX:
+        raise ErreurRequete(400, f"Âge invalide : {p.get('age')!r} (attendu : {AGE_MIN}–{AGE_MAX})")
+    densite = p.get("densite")
+    if densite not in DENSITES:
+        densite = densite_depuis_zone(str(p.get("zone") or densite or ""))
+        if densite is None:
+            raise ErreurRequete(400, "Densité inconnue (attendu : 'forte' ou 'faible', ou une zone)")
+    return age, densite
+
+
+def devis_unitaire(p) -> bytes:
+    return _DEVIS_SERIALISES[_lire_prospect(p)]
+
+
+def devis_lot(corps) -> bytes:
+    prospects = corps.get("prospects") if isinstance(corps, dict) else corps
+    if not isinstance(prospects, list):
+        raise ErreurRequete(400, "Attendu : {\"prospects\": [...]} ou une liste de prospects")
+    if len(prospects) > LOT_MAX:
+        raise ErreurRequete(413, f"Lot limité à {LOT_MAX} prospects")
+    lus = [_lire_prospect(p) for p in prospects]
+    ages = np.fromiter((a for a, _ in lus), dtype=np.int64, count=len(lus))
+    codes = np.fromiter((d == "faible" for _, d in lus), dtype=bool, count=len(lus))
+    pp, ch, pc = calcul_primes_vectorise(ages, codes)
+    devis = [
+        {
+            "age": a, "densite": d,
+            "prime_pure": round(p, 2), "chargements": round(c, 2), "prime_commerciale": round(t, 2),
+        }
+        for (a, d), p, c, t in zip(lus, pp.tolist(), ch.tolist(), pc.tolist())
+    ]
+    return json.dumps({"devis": devis}).encode()
+
+
+def router(methode: str, cible: str, corps: bytes) -> bytes:
+    url = urlsplit(cible)
+    if url.path == "/sante":
+        if methode != "GET":
+            raise ErreurRequete(405, "Méthode non autorisée")
+        return b'{"statut":"ok"}'
+    if url.path == "/devis":
+        if methode == "GET":
+            return devis_unitaire(dict(parse_qsl(url.query)))
+        if methode == "POST":
+            return devis_unitaire(_json(corps))
+        raise ErreurRequete(405, "Méthode non autorisée")
+    if url.path == "/devis/lot":
+        if methode != "POST":
+            raise ErreurRequete(405, "Méthode non autorisée")
+        return devis_lot(_json(corps))
+    raise ErreurRequete(404, "Route inconnue")
+
+
+def _json(corps: bytes):
+    try:
+        return json.loads(corps)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise ErreurRequete(400, "Corps JSON invalide") from None
+
+
+# ─────────────────────────────────────────────
+# PROTOCOLE HTTP/1.1
+# ─────────────────────────────────────────────
+def _reponse(statut: int, corps: bytes, garder: bool) -> bytes:
+    entetes = (
+        f"HTTP/1.1 {statut} {_RAISONS[statut]}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(corps)}\r\n"
+        f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n"
+    )
+    return entetes.encode("latin-1") + corps
+
+
+def _erreur(e: ErreurRequete, garder: bool) -> bytes:
+    return _reponse(e.statut, json.dumps({"erreur": str(e)}).encode(), garder)
+
+
+async def _lire_requete(reader: asyncio.StreamReader):
+    """Lit une requête ; retourne (méthode, cible, corps, keep-alive) ou None en fin de flux."""
+    try:
+        brut = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), DELAI_INACTIVITE)
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise ErreurRequete(400, "Requête incomplète") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise ErreurRequete(431, "En-têtes trop volumineux") from None
+    except asyncio.TimeoutError:
+        return None
+
+    lignes = brut.decode("latin-1").split("\r\n")
+    try:
+        methode, cible, version = lignes[0].split(" ")
+    except ValueError:
+        raise ErreurRequete(400, "Ligne de requête invalide") from None
+    entetes = {}
+    for ligne in lignes[1:]:
+        if ligne:
+            nom, _, valeur = ligne.partition(":")
+            entetes[nom.strip().lower()] = valeur.strip()
+
+    connexion = entetes.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        garder = connexion != "close"
+    else:
+        garder = connexion == "keep-alive"
+
+    if "chunked" in entetes.get("transfer-encoding", "").lower():
+        raise ErreurRequete(411, "Content-Length requis")
+    try:
+        longueur = int(entetes.get("content-length", "0"))
+    except ValueError:
+        raise ErreurRequete(400, "Content-Length invalide") from None
+    if longueur < 0:
+        raise ErreurRequete(400, "Content-Length invalide")
+    if longueur > TAILLE_MAX_CORPS:
+        raise ErreurRequete(413, "Corps trop volumineux")
+    corps = b""
+    try:
+        if longueur:
+            corps = await asyncio.wait_for(reader.readexactly(longueur), DELAI_INACTIVITE)
+    except asyncio.IncompleteReadError:
+        raise ErreurRequete(400, "Corps incomplet") from None
+    except asyncio.TimeoutError:
+        # Corps annoncé mais jamais reçu en entier : on ferme, comme pour les en-têtes
+        return None
+    return methode, cible, corps, garder
+
+
+async def servir_connexion(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            try:
+                requete = await _lire_requete(reader)
+            except ErreurRequete as e:
+                # Flux désynchronisé : on répond puis on ferme
+                writer.write(_erreur(e, False))
+                break
+            if requete is None:
+                break
+            methode, cible, corps, garder = requete
+            try:
+                writer.write(_reponse(200, router(methode, cible, corps), garder))
+            except ErreurRequete as e:
+                writer.write(_erreur(e, garder))
+            await writer.drain()
+            if not garder:
+                break
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+async def lancer(hote: str, port: int):
+    serveur = await asyncio.start_server(
+        servir_connexion, hote, port, limit=TAILLE_MAX_ENTETES
+    )
+    print(f"Service de devis à l'écoute sur http://{hote}:{port}", file=sys.stderr)
+    async with serveur:
+        await serveur.serve_forever()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Service HTTP de devis Umbrella Santé Senior.")
+    parser.add_argument("--hote", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(lancer(args.hote, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
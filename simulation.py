@@ -0,0 +1,184 @@
+"""Simulation Monte-Carlo des résultats annuels d'un portefeuille senior.
+
+Usage :
+    python simulation.py --effectif 1000 --scenarios 200000
+    python simulation.py --portefeuille portefeuille.csv --graine 42 --processus 8
+
+Le portefeuille est décrit par des effectifs par cellule (âge, densité) :
+CSV « age,densite,effectif », ou --effectif assurés dans chaque cellule.
+Modèle de sinistralité (Poisson composé – gamma) : chaque assuré subit un
+nombre de sinistres de loi de Poisson de paramètre --frequence, chacun de
+coût gamma de forme --forme, calibré pour que le coût moyen annuel égale
+la prime pure de sa cellule. La somme de N coûts gamma(k, θ) suivant une
+loi gamma(N·k, θ), une cellule se simule en deux tirages par scénario
+quelle que soit sa taille, sans boucle par assuré.
+
+Les scénarios sont répartis en lots de taille fixe, chacun avec son flux
+aléatoire issu de SeedSequence(graine).spawn() : le résultat ne dépend que
+de la graine, pas du nombre de processus du pool.
+Les hypothèses de fréquence et de forme par défaut sont illustratives ;
+les remplacer par celles des actuaires.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from actuariat import AGE_MAX, AGE_MIN, DENSITES, TAUX_FRAIS, calcul_primes_vectorise, indices_densite
+from devis_masse import densite_depuis_zone
+
+FREQUENCE_SINISTRES = 4.0      # sinistres par assuré et par an
+FORME_GAMMA         = 0.8      # forme du coût unitaire (CV = 1 / √forme)
+TAILLE_LOT          = 10_000   # scénarios par lot (et par flux aléatoire)
+QUANTILES           = (0.5, 0.9, 0.95, 0.99, 0.995)
+
+
+@dataclass(frozen=True)
+class Portefeuille:
+    ages: np.ndarray
+    densites: np.ndarray     # codes 0 = forte / 1 = faible
+    effectifs: np.ndarray
+
+    @property
+    def assures(self) -> int:
+        return int(self.effectifs.sum())
+
+
+def portefeuille_uniforme(effectif: int) -> Portefeuille:
+    """`effectif` assurés dans chacune des cellules âge × densité du barème."""
+    ages = np.repeat(np.arange(AGE_MIN, AGE_MAX + 1), len(DENSITES))
+    densites = np.tile(np.arange(len(DENSITES)), AGE_MAX - AGE_MIN + 1)
+    return Portefeuille(ages, densites, np.full(ages.shape, effectif, dtype=np.int64))
+
+
+def lire_portefeuille(chemin: str) -> Portefeuille:
+    ages, densites, effectifs = [], [], []
+    with open(chemin, encoding="utf-8-sig", newline="") as f:
+        for numero, ligne in enumerate(csv.DictReader(f), start=2):
+            densite = densite_depuis_zone(ligne.get("densite") or ligne.get("zone") or "")
+            if densite is None:
+                raise ValueError(f"{chemin}, ligne {numero} : densité inconnue")
+            ages.append(int(ligne["age"]))
+            densites.append(densite)
+            effectifs.append(int(ligne["effectif"]))
+    if not ages:
+        raise ValueError(f"{chemin} : portefeuille vide")
+    return Portefeuille(
+        np.array(ages), indices_densite(np.array(densites)), np.array(effectifs, dtype=np.int64)
+    )
+
+
+# ─────────────────────────────────────────────
+# TIRAGES
+# ─────────────────────────────────────────────
+def simuler_lot(graine, scenarios: int, effectifs: np.ndarray, primes_pures: np.ndarray,
+                frequence: float, forme: float) -> np.ndarray:
+    """Charge de sinistres totale du portefeuille pour `scenarios` années simulées."""
+    rng = np.random.default_rng(graine)
+    # Coût unitaire moyen de la cellule = prime pure / fréquence ; échelle gamma = moyenne / forme
+    echelle = primes_pures / (frequence * forme)
+    nombres = rng.poisson(effectifs * frequence, size=(scenarios, len(effectifs)))
+    couts = rng.gamma(nombres * forme, echelle)
+    return couts.sum(axis=1)
+
+
+def simuler(
+    portefeuille: Portefeuille,
+    scenarios: int,
+    graine: int = 0,
+    processus: int | None = None,
+    frequence: float = FREQUENCE_SINISTRES,
+    forme: float = FORME_GAMMA,
+    taille_lot: int = TAILLE_LOT,
+) -> np.ndarray:
+    """Charges de sinistres simulées (une par scénario), réparties sur un pool de processus."""
+    primes_pures, _, _ = calcul_primes_vectorise(portefeuille.ages, portefeuille.densites)
+    tailles = [min(taille_lot, scenarios - debut) for debut in range(0, scenarios, taille_lot)]
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    arguments = [
+        (g, n, portefeuille.effectifs, primes_pures, frequence, forme)
+        for g, n in zip(graines, tailles)
+    ]
+    if processus == 1 or len(arguments) == 1:
+        return np.concatenate([simuler_lot(*a) for a in arguments])
+    with ProcessPoolExecutor(max_workers=processus) as pool:
+        return np.concatenate(list(pool.map(simuler_lot, *zip(*arguments))))
+
+
+# ─────────────────────────────────────────────
+# SYNTHÈSE
+# ─────────────────────────────────────────────
+def synthese(portefeuille: Portefeuille, sinistres: np.ndarray) -> dict:
+    """Rapport sinistres / primes, quantiles et probabilité de perte.
+
+    Résultat d'un scénario = primes commerciales − frais (TAUX_FRAIS de la
+    prime) − sinistres : négatif quand la marge ne couvre pas l'écart de
+    sinistralité.
+    """
+    pp, _, pc = calcul_primes_vectorise(portefeuille.ages, portefeuille.densites)
+    primes = float(pc @ portefeuille.effectifs)
+    primes_pures = float(pp @ portefeuille.effectifs)
+    rapports = sinistres / primes
+    resultats = primes * (1 - TAUX_FRAIS) - sinistres
+    seuil_99 = np.quantile(sinistres, 0.99)
+    return {
+        "assures": portefeuille.assures,
+        "scenarios": len(sinistres),
+        "primes_commerciales": round(primes, 2),
+        "primes_pures": round(primes_pures, 2),
+        "sinistres_moyens": round(float(sinistres.mean()), 2),
+        "sinistres_ecart_type": round(float(sinistres.std()), 2),
+        "rapport_sp_moyen": round(float(rapports.mean()), 4),
+        "rapport_sp_quantiles": {
+            f"{q:.1%}": round(float(v), 4) for q, v in zip(QUANTILES, np.quantile(rapports, QUANTILES))
+        },
+        "sinistres_tvar_99": round(float(sinistres[sinistres >= seuil_99].mean()), 2),
+        "resultat_moyen": round(float(resultats.mean()), 2),
+        "probabilite_perte": float(np.mean(resultats < 0)),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulation Monte-Carlo d'un portefeuille Santé Senior.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--portefeuille", help="CSV age,densite,effectif")
+    source.add_argument("--effectif", type=int, default=1000,
+                        help="assurés par cellule âge × densité si pas de CSV (défaut : 1000)")
+    parser.add_argument("--scenarios", type=int, default=100_000, help="années simulées (défaut : 100000)")
+    parser.add_argument("--graine", type=int, default=0, help="graine (défaut : 0)")
+    parser.add_argument("--processus", type=int, default=None,
+                        help="taille du pool de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--frequence", type=float, default=FREQUENCE_SINISTRES,
+                        help=f"sinistres par assuré et par an (défaut : {FREQUENCE_SINISTRES})")
+    parser.add_argument("--forme", type=float, default=FORME_GAMMA,
+                        help=f"forme gamma du coût unitaire (défaut : {FORME_GAMMA})")
+    args = parser.parse_args(argv)
+
+    try:
+        portefeuille = (
+            lire_portefeuille(args.portefeuille) if args.portefeuille
+            else portefeuille_uniforme(args.effectif)
+        )
+        if args.frequence <= 0 or args.forme <= 0 or args.scenarios < 1:
+            raise ValueError("fréquence, forme et nombre de scénarios doivent être positifs")
+        debut = time.perf_counter()
+        sinistres = simuler(portefeuille, args.scenarios, args.graine, args.processus,
+                            args.frequence, args.forme)
+        duree = time.perf_counter() - debut
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(synthese(portefeuille, sinistres), ensure_ascii=False, indent=2))
+    print(f"{portefeuille.assures * args.scenarios:,} années-assuré simulées en {duree:.2f} s "
+          f"({args.processus or os.cpu_count()} processus)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Préparation web des vidéos MP4/MOV (« faststart »), en Python pur.
+
+Un fichier dont l'atome `moov` (index des échantillons) est placé après
+`mdat` (les données) oblige le navigateur à tout télécharger avant de
+lire la première image. preparer_video() produit une copie où `moov` est
+déplacé en tête, avec les offsets de blocs (stco / co64) corrigés.
+"""
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from ressources import (
+    DOSSIER_ASSETS, RACINE,
+    empreinte_fichier, hash_fichier, publier_fichier, service_statique_actif,
+)
+
+DOSSIER_CACHE_VIDEO = os.path.join(RACINE, ".cache", "video")
+# Au-delà, le service statique de Streamlit refuse le fichier
+TAILLE_MAX_STATIQUE = 200 * 1024 * 1024
+
+EXTENSIONS_VIDEO = (".mp4", ".mov")
+
+# Atomes conteneurs à parcourir pour trouver les tables d'offsets
+_CONTENEURS = {b"moov", b"trak", b"mdia", b"minf", b"stbl", b"edts", b"dinf"}
+
+
+class ErreurVideo(ValueError):
+    pass
+
+
+# ─────────────────────────────────────────────
+# LECTURE DE LA STRUCTURE
+# ─────────────────────────────────────────────
+def atomes_racine(chemin: str) -> list[tuple[bytes, int, int]]:
+    """Liste des atomes de premier niveau : (type, offset, taille totale)."""
+    atomes = []
+    taille_fichier = os.path.getsize(chemin)
+    with open(chemin, "rb") as f:
+        offset = 0
+        while offset < taille_fichier:
+            f.seek(offset)
+            entete = f.read(8)
+            if len(entete) < 8:
+                raise ErreurVideo(f"En-tête d'atome tronqué à l'offset {offset}")
+            taille, type_ = struct.unpack(">I4s", entete)
+            if taille == 1:
+                (taille,) = struct.unpack(">Q", f.read(8))
+            elif taille == 0:
+                taille = taille_fichier - offset
+            if taille < 8 or offset + taille > taille_fichier:
+                raise ErreurVideo(f"Atome {type_!r} de taille invalide à l'offset {offset}")
+            atomes.append((type_, offset, taille))
+            offset += taille
+    return atomes
+
+
+def est_faststart(chemin: str) -> bool:
+    """Vrai si `moov` précède `mdat` (lecture possible avant la fin du téléchargement)."""
+    types = [t for t, _, _ in atomes_racine(chemin)]
+    if b"moov" not in types:
+        raise ErreurVideo("Aucun atome moov : fichier MP4/MOV invalide")
+    return b"mdat" not in types or types.index(b"moov") < types.index(b"mdat")
+
+
+def _tables_offsets(moov: bytearray, debut: int | None = None, fin: int | None = None):
+    """Itère sur les tables stco / co64 de `moov` : (type, position du contenu)."""
+    if debut is None:
+        debut = 16 if struct.unpack_from(">I", moov, 0)[0] == 1 else 8
+    fin = len(moov) if fin is None else fin
+    pos = debut
+    while pos + 8 <= fin:
+        taille, type_ = struct.unpack_from(">I4s", moov, pos)
+        entete = 8
+        if taille == 1:
+            (taille,) = struct.unpack_from(">Q", moov, pos + 8)
+            entete = 16
+        elif taille == 0:
+            taille = fin - pos
+        if taille < entete or pos + taille > fin:
+            raise ErreurVideo(f"Atome {type_!r} corrompu dans moov")
+        if type_ == b"cmov":
+            raise ErreurVideo("moov compressé (cmov) non pris en charge")
+        if type_ in _CONTENEURS:
+            yield from _tables_offsets(moov, pos + entete, pos + taille)
+        elif type_ in (b"stco", b"co64"):
+            yield type_, pos + entete
+        pos += taille
+
+
+# ─────────────────────────────────────────────
+# RÉÉCRITURE DE MOOV
+# ─────────────────────────────────────────────
+def _stco_vers_co64(moov: bytes) -> bytearray:
+    """Convertit les tables stco (32 bits) en co64, en corrigeant les tailles parentes."""
+    def reecrire(bloc: bytes) -> bytes:
+        sortie = bytearray()
+        pos = 0
+        while pos + 8 <= len(bloc):
+            taille, type_ = struct.unpack_from(">I4s", bloc, pos)
+            entete = 8
+            if taille == 1:
+                (taille,) = struct.unpack_from(">Q", bloc, pos + 8)
+                entete = 16
+            elif taille == 0:
+                taille = len(bloc) - pos
+            contenu = bloc[pos + entete:pos + taille]
+            if type_ in _CONTENEURS:
+                contenu = reecrire(contenu)
+            elif type_ == b"stco":
+                version_flags, n = struct.unpack_from(">II", contenu, 0)
+                valeurs = struct.unpack_from(f">{n}I", contenu, 8)
+                contenu = struct.pack(f">II{n}Q", version_flags, n, *valeurs)
+                type_ = b"co64"
+            sortie += struct.pack(">I4s", len(contenu) + 8, type_) + contenu
+            pos += taille
+        return bytes(sortie)
+
+    taille, type_ = struct.unpack_from(">I4s", moov, 0)
+    entete = 16 if taille == 1 else 8
+    contenu = reecrire(moov[entete:])
+    return bytearray(struct.pack(">I4s", len(contenu) + 8, b"moov") + contenu)
+
+
+def _reindexer_offsets(moov: bytearray, nouvel_offset) -> bool:
+    """Remplace chaque offset de bloc v par nouvel_offset(v).
+
+    Retourne False si un offset 32 bits déborde (conversion en co64 requise).
+    """
+    for type_, pos in _tables_offsets(moov):
+        (n,) = struct.unpack_from(">I", moov, pos + 4)
+        fmt = f">{n}I" if type_ == b"stco" else f">{n}Q"
+        valeurs = [nouvel_offset(v) for v in struct.unpack_from(fmt, moov, pos + 8)]
+        if type_ == b"stco" and valeurs and max(valeurs) > 0xFFFFFFFF:
+            return False
+        struct.pack_into(fmt, moov, pos + 8, *valeurs)
+    return True
+
+
+def faststart(source: str, destination: str):
+    """Écrit dans `destination` une copie de `source` avec moov placé avant mdat."""
+    atomes = atomes_racine(source)
+    types = [t for t, _, _ in atomes]
+    if b"moov" not in types or b"mdat" not in types:
+        raise ErreurVideo("Atomes moov / mdat introuvables")
+    i_moov = types.index(b"moov")
+    i_insertion = types.index(b"mdat")
+    if i_moov < i_insertion:
+        raise ErreurVideo("Fichier déjà optimisé (moov avant mdat)")
+
+    _, offset_moov, taille_moov = atomes[i_moov]
+    offset_insertion = atomes[i_insertion][1]
+    fin_moov = offset_moov + taille_moov
+    with open(source, "rb") as f:
+        f.seek(offset_moov)
+        original = f.read(taille_moov)
+
+    def reindexer(moov: bytearray) -> bool:
+        # Données entre le point d'insertion et l'ancien moov : décalées de la
+        # taille du nouveau moov ; données après l'ancien moov : décalées de
+        # sa croissance éventuelle (conversion co64).
+        croissance = len(moov) - taille_moov
+        def nouvel_offset(v):
+            if offset_insertion <= v < offset_moov:
+                return v + len(moov)
+            if v >= fin_moov:
+                return v + croissance
+            return v
+        return _reindexer_offsets(moov, nouvel_offset)
+
+    moov = bytearray(original)
+    if not reindexer(moov):
+        moov = _stco_vers_co64(original)
+        reindexer(moov)
+
+    tmp = f"{destination}.{os.getpid()}.tmp"
+    try:
+        with open(source, "rb") as src, open(tmp, "wb") as dst:
+            for i, (type_, offset, taille) in enumerate(atomes):
+                if i == i_insertion:
+                    dst.write(moov)
+                if i == i_moov:
+                    continue
+                src.seek(offset)
+                _copier(src, dst, taille)
+        os.replace(tmp, destination)
+    except BaseException:
+        # Disque plein, source tronquée… : pas de copie partielle laissée en cache
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _copier(src, dst, taille: int, bloc: int = 1 << 20):
+    while taille > 0:
+        donnees = src.read(min(bloc, taille))
+        if not donnees:
+            raise ErreurVideo("Fichier source tronqué pendant la copie")
+        dst.write(donnees)
+        taille -= len(donnees)
+
+
+# ─────────────────────────────────────────────
+# CACHE
+# ─────────────────────────────────────────────
+@lru_cache(maxsize=8)
+def _preparer(chemin: str, mtime_ns: int) -> str:
+    if est_faststart(chemin):
+        return chemin
+    ext = os.path.splitext(chemin)[1].lower()
+    cible = os.path.join(DOSSIER_CACHE_VIDEO, f"{hash_fichier(chemin)}{ext}")
+    if not os.path.exists(cible):
+        try:
+            os.makedirs(DOSSIER_CACHE_VIDEO, exist_ok=True)
+            faststart(chemin, cible)
+        except OSError:
+            # Dossier en lecture seule ou disque plein : l'original reste lisible,
+            # repli mis en cache pour ne pas retenter à chaque rerun
+            return chemin
+    return cible
+
+
+def preparer_video(chemin: str) -> str:
+    """Chemin d'une version faststart de la vidéo (l'original s'il l'est déjà).
+
+    La copie optimisée est mise en cache sous .cache/video/<sha256 de la source> ;
+    un fichier illisible, ou un cache impossible à écrire, laisse l'original
+    tel quel plutôt que de bloquer la page.
+    """
+    try:
+        return _preparer(*empreinte_fichier(chemin))
+    except (ErreurVideo, struct.error):
+        return chemin
+
+
+def url_video(chemin: str, nom: str | None = None) -> str | None:
+    """URL statique de la vidéo, servie depuis le disque avec prise en charge de Range.
+
+    Le navigateur ne télécharge que les plages demandées (lecture, avance
+    rapide) et le serveur ne garde pas le fichier en mémoire. Retourne None
+    si le service statique est inactif, le fichier trop gros ou static/cache/
+    non inscriptible : l'appelant se rabat alors sur st.video.
+    """
+    if not service_statique_actif() or os.path.getsize(chemin) > TAILLE_MAX_STATIQUE:
+        return None
+    return publier_fichier(chemin, nom)
+
+
+# ─────────────────────────────────────────────
+# DÉTECTION ET PRÉPARATION DIFFÉRÉE
+# ─────────────────────────────────────────────
+def trouver_video(dossier: str = DOSSIER_ASSETS) -> str | None:
+    """Premier fichier .mp4 / .mov du dossier (ordre alphabétique), ou None."""
+    if not os.path.isdir(dossier):
+        return None
+    for f in sorted(os.listdir(dossier)):
+        if f.lower().endswith(EXTENSIONS_VIDEO) and not f.startswith("."):
+            return os.path.join(dossier, f)
+    return None
+
+
+def video_web(chemin: str) -> tuple[str, str | None]:
+    """(chemin de la version faststart, URL statique ou None) de la vidéo."""
+    prete = preparer_video(chemin)
+    return prete, url_video(prete, os.path.basename(chemin))
+
+
+_executeur = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video")
+_preparations = {}
+_verrou = threading.Lock()
+
+
+def video_web_differee(chemin: str) -> tuple[str, str | None] | None:
+    """Comme video_web(), sans bloquer : la réécriture faststart et le hash
+    de publication tournent en arrière-plan, None tant qu'ils ne sont pas finis."""
+    cle = empreinte_fichier(chemin)
+    with _verrou:
+        futur = _preparations.get(cle)
+        if futur is None:
+            futur = _preparations[cle] = _executeur.submit(video_web, chemin)
+    if not futur.done():
+        return None
+    try:
+        return futur.result()
+    except Exception:
+        # Échec imprévu : l'original est servi et l'entrée oubliée, le rerun
+        # suivant relance la préparation au lieu de relever la même erreur
+        with _verrou:
+            if _preparations.get(cle) is futur:
+                del _preparations[cle]
+        return chemin, None